@@ -1,8 +1,16 @@
 import hszinc
+import io
+import os
+import pandas as pd  # type: ignore
+import tempfile
+import time
 import timeit
+import tracemalloc
 import zincio
 
 from pathlib import Path
+from zincio.zinc_parser import ZincParser
+from zincio.zinc_tokenizer import make_tokenizer, tokenize, TOKENIZERS
 
 
 def get_abspath(relpath):
@@ -24,6 +32,58 @@ MEDIUM_FILENAME = get_abspath("medium_example.zinc")
 small_example = read_file(SMALL_FILENAME)
 medium_example = read_file(MEDIUM_FILENAME)
 
+
+def count_tokens(s, tokenizer):
+    return sum(1 for _ in tokenize(s, tokenizer))
+
+
+for filename, example in [(SMALL_FILENAME, small_example),
+                          (MEDIUM_FILENAME, medium_example)]:
+    for tokenizer in TOKENIZERS:
+        print(f"tokenizing {filename} with zincio ({tokenizer} engine)...")
+        ntokens = count_tokens(example, tokenizer)
+        tokenize_total = timeit.timeit(
+            lambda: count_tokens(example, tokenizer), number=20)
+        print(f"tokenizing took {tokenize_total / 20} seconds, avg of 20 "
+              f"({ntokens * 20 / tokenize_total:.0f} tokens/sec)")
+
+
+def count_cells(s):
+    rows = [line for line in s.split("\n")[2:] if line]
+    return sum(row.count(",") + 1 for row in rows)
+
+
+def traced_bytes(fn):
+    """Returns the bytes still allocated by fn's result, and the peak."""
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current, peak
+
+
+ncells = count_cells(medium_example)
+for tokenizer in TOKENIZERS:
+    held, _ = traced_bytes(lambda: list(tokenize(medium_example, tokenizer)))
+    print(f"token stream of {MEDIUM_FILENAME} ({tokenizer} engine) holds "
+          f"{held / ncells:.1f} bytes per cell")
+_, peak = traced_bytes(lambda: zincio.parse(medium_example))
+print(f"parsing {MEDIUM_FILENAME} peaks at {peak / ncells:.1f} bytes per cell")
+
+# A numeric his grid, whose Number columns are stored in typed arrays
+his_columns = ",".join(f'v{i} kind:"Number" unit:"kW"' for i in range(50))
+his_example = ("ver:\"3.0\"\nts," + his_columns + "\n").encode() + b"".join(
+    f"{ts.isoformat()} Los_Angeles,".encode()
+    + ",".join(f"{(i * 7 + j) % 997 / 8:.3f}kW" for j in range(50)).encode()
+    + b"\n"
+    for i, ts in enumerate(pd.date_range(
+        "2020-01-01", periods=20_000, freq="min", tz="America/Los_Angeles")))
+held, peak = traced_bytes(lambda: zincio.parse(his_example))
+print(f"parsing a numeric his grid of 20000x51 cells peaks at "
+      f"{peak / (20_000 * 51):.1f} bytes per cell "
+      f"(the Grid holds {held / (20_000 * 51):.1f})")
+
 print(f"parsing {SMALL_FILENAME} with zincio...")
 zincio_total = timeit.timeit(
     lambda: zincio.parse(small_example), number=20)
@@ -38,6 +98,79 @@ zincio_total = timeit.timeit(
     lambda: zincio.parse(medium_example), number=20)
 print(f"parsing with zincio took {zincio_total / 20} seconds, avg of 20")
 
+
+def parse_rows(s):
+    """Parses the rows of s into a GridBuilder, without building the Grid."""
+    parser = ZincParser(make_tokenizer(io.StringIO(s)))
+    gb = parser._start_grid()
+    for cells in parser.iter_rows():
+        gb.add_row(cells)
+    return gb
+
+
+def time_build(s, number):
+    """Returns the average time taken to build the Grid from parsed rows."""
+    total = 0.0
+    for _ in range(number):
+        gb = parse_rows(s)
+        t0 = time.perf_counter()
+        gb.build()
+        total += time.perf_counter() - t0
+    return total / number
+
+
+for filename, example in [(SMALL_FILENAME, small_example),
+                          (MEDIUM_FILENAME, medium_example)]:
+    print(f"building the DataFrame of {filename} took "
+          f"{time_build(example, 20)} seconds, avg of 20")
+
+medium_grid = zincio.parse(medium_example)
+print(f"writing {MEDIUM_FILENAME} with zincio...")
+zincio_total = timeit.timeit(lambda: medium_grid.to_zinc(), number=20)
+print(f"writing with zincio took {zincio_total / 20} seconds, avg of 20 "
+      f"({len(medium_grid.data) * 20 / zincio_total:.0f} rows/sec)")
+
+# The medium example's rows repeated 100 times, written in chunks or not
+large_grid = zincio.Grid(
+    version=medium_grid.version,
+    grid_info=medium_grid.grid_info,
+    column_info=medium_grid.column_info,
+    data=pd.concat([medium_grid.data] * 100))
+for chunksize in (None, 1000):
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        _, peak = traced_bytes(lambda: large_grid.to_zinc(f, chunksize))
+    print(f"writing {len(large_grid.data)} rows with chunksize={chunksize} "
+          f"peaks at {peak / 2**20:.1f} MiB")
+
+print(f"parsing {MEDIUM_FILENAME} with zincio (regex tokenizer)...")
+zincio_total = timeit.timeit(
+    lambda: zincio.parse(medium_example, tokenizer="regex"), number=20)
+print(f"parsing with zincio took {zincio_total / 20} seconds, avg of 20")
+
 print(f"parsing {MEDIUM_FILENAME} with hszinc...")
 hszinc_total = timeit.timeit(lambda: hszinc.parse(medium_example), number=3)
 print(f"parsing with hszinc took {hszinc_total / 3} seconds, avg of 3")
+
+# Repeat the rows of the medium example to make a file worth splitting
+header, _, rows = medium_example.partition("\n")
+colnames, _, rows = rows.partition("\n")
+large_example = "\n".join([header, colnames] + [rows.rstrip("\n")] * 20) + "\n"
+with tempfile.TemporaryDirectory() as tmpdir:
+    large_filename = os.path.join(tmpdir, "large_example.zinc")
+    with open(large_filename, "w", encoding="utf-8") as f:
+        f.write(large_example)
+    for workers in (1, 2, 4, 8):
+        print(f"reading {large_filename} with zincio ({workers} workers)...")
+        zincio_total = timeit.timeit(
+            lambda: zincio.read(large_filename, workers=workers), number=3)
+        print(f"reading with zincio took {zincio_total / 3} seconds, "
+              "avg of 3")
+
+# A ts-only his grid, to measure the cost of the timestamps alone
+ts_example = "ver:\"3.0\"\nts\n" + "".join(
+    f"{ts.isoformat()} Los_Angeles\n" for ts in pd.date_range(
+        "2020-01-01", periods=50_000, freq="min", tz="America/Los_Angeles"))
+print("parsing a ts-only grid of 50000 rows with zincio...")
+zincio_total = timeit.timeit(lambda: zincio.parse(ts_example), number=3)
+print(f"parsing with zincio took {zincio_total / 3} seconds, avg of 3 "
+      f"({50_000 * 3 / zincio_total:.0f} rows/sec)")
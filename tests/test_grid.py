@@ -1,3 +1,4 @@
+import pytest  # type: ignore
 import zincio
 from pathlib import Path
 
@@ -24,3 +25,63 @@ def test_grid_to_zinc_file(tmp_path):
     with open(output_file, encoding="utf-8") as f:
         actual = f.read()
     assert actual == expected
+
+
+def test_grid_to_zinc_formats_offsets_fractions_and_units():
+    grid = zincio.parse(
+        'ver:"3.0"\n'
+        'ts tz:"Los_Angeles",v0 unit:"kW",v1 kind:"Bool"\n'
+        '2020-11-01T01:30:00.25-07:00 Los_Angeles,1.25kW,T\n'
+        '2020-11-01T01:30:00-08:00 Los_Angeles,N,N\n'
+        '2020-11-01T02:00:00-08:00 Los_Angeles,3kW,F\n')
+    assert grid.to_zinc() == (
+        'ver:"3.0"\n'
+        'ts tz:"Los_Angeles",v0 unit:"kW",v1 kind:"Bool"\n'
+        '2020-11-01T01:30:00.250000-07:00 Los_Angeles,1.25kW,True\n'
+        '2020-11-01T01:30:00-08:00 Los_Angeles,,\n'
+        '2020-11-01T02:00:00-08:00 Los_Angeles,3.0kW,False\n')
+
+
+def test_grid_to_zinc_in_chunks(tmp_path):
+    with open(SINGLE_SERIES_FILE, encoding="utf-8") as f:
+        expected = f.read()
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    for chunksize in (1, 2, 1000):
+        assert grid.to_zinc(chunksize=chunksize) == expected
+    output_file = tmp_path / "output.zinc"
+    with open(output_file, "w", encoding="utf-8") as f:
+        grid.to_zinc(f, chunksize=2)
+    with open(output_file, encoding="utf-8") as f:
+        assert f.read() == expected
+    with pytest.raises(ValueError):
+        grid.to_zinc(chunksize=0)
+
+
+def test_grid_iter_zinc():
+    with open(SINGLE_SERIES_FILE, encoding="utf-8") as f:
+        expected = f.read()
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    chunks = list(grid.iter_zinc(chunk_rows=2))
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert len(chunks) == 1 + (len(grid.data) + 1) // 2
+    assert b"".join(chunks).decode("utf-8") == expected
+    with pytest.raises(ValueError):
+        next(grid.iter_zinc(chunk_rows=0))
+
+
+@pytest.mark.parametrize('suffix', ['.gz', '.bz2', '.xz'])
+def test_grid_to_zinc_compressed(tmp_path, suffix):
+    with open(SINGLE_SERIES_FILE, encoding="utf-8") as f:
+        expected = f.read()
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    output_file = tmp_path / ("output.zinc" + suffix)
+    grid.to_zinc(output_file, chunksize=2)
+    with open(output_file, "rb") as f:
+        assert not f.read().startswith(b"ver")
+    assert zincio.read(output_file).to_zinc() == expected
+    with open(output_file, "rb") as f:
+        compression = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz'}[suffix]
+        assert zincio.read(f, compression=compression).to_zinc() == expected
+    grid.to_zinc(output_file, compression=None)
+    with open(output_file, encoding="utf-8") as f:
+        assert f.read() == expected
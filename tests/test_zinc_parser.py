@@ -1,9 +1,15 @@
 # coding: utf-8
+import asyncio
+import datetime
 import io
+import os
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import pytest  # type: ignore
 import zincio
+from zincio import compression as compression_module
+from zincio import zinc_parser
+from zincio.zinc_tokenizer import ZincTokenizerException
 
 from pandas.api.types import CategoricalDtype  # type: ignore
 from pathlib import Path
@@ -174,7 +180,7 @@ def test_read_zinc_grid():
             pd.to_datetime('2020-05-18T00:05:00-07:00'),
             pd.to_datetime('2020-05-18T01:13:09-07:00'),
         ],
-        name='ts')
+        name='ts').tz_convert('America/Los_Angeles')
     expected_dataframe = pd.DataFrame(
         index=expected_index,
         data={
@@ -259,7 +265,7 @@ def test_read_zinc_single_series():
                 pd.to_datetime('2020-05-18T01:13:09-07:00'),
             ],
             name='ts',
-        ))
+        ).tz_convert('America/Los_Angeles'))
     expected = zincio.Grid(
         version=3,
         grid_info=expected_grid_info,
@@ -288,7 +294,7 @@ def test_read_zinc_deficient_column_info():
                 pd.to_datetime('2020-04-01T00:10:00-07:00'),
             ],
             name='ts',
-        ))
+        ).tz_convert('America/Los_Angeles'))
     expected = zincio.Grid(
         version=3,
         grid_info=expected_grid_info,
@@ -315,25 +321,27 @@ def test_read_zinc_minimal_colinfo():
         v9=dict(id=zincio.Ref("vrt.x19.motion_count", None)))
     expected_data = pd.DataFrame(
         data={
-            "@vrt.x02.motion_state": [False, None, None],
+            "@vrt.x02.motion_state": pd.array(
+                [False, None, None], dtype="boolean"),
             "@vrt.x02.temperature": [25.5586, np.nan, np.nan],
             "@vrt.x18.humidity": [np.nan, 62.3369, np.nan],
             "@vrt.x18.illuminance": [np.nan, 927, np.nan],
             "@vrt.x18.motion_count": [np.nan, 1, np.nan],
-            "@vrt.x18.motion_state": [None, True, None],
+            "@vrt.x18.motion_state": pd.array(
+                [None, True, None], dtype="boolean"),
             "@vrt.x18.temperature": [np.nan, 26.1035, np.nan],
             "@vrt.x19.humidity": [np.nan, np.nan, 63.5195],
             "@vrt.x19.illuminance": [np.nan, np.nan, 945],
             "@vrt.x19.motion_count": [np.nan, np.nan, 11],
         },
-        index=pd.Series(
-            data=[
+        index=pd.DatetimeIndex(
+            [
                 pd.to_datetime("2018-03-21T15:45:00+10:00"),
                 pd.to_datetime("2018-03-21T14:30:00+10:00"),
                 pd.to_datetime("2018-03-21T14:45:00+10:00"),
             ],
             name='ts'
-        )
+        ).tz_convert('Etc/GMT-10')
     )
     expected = zincio.Grid(
         version=2,
@@ -358,17 +366,18 @@ def test_parse_grid_with_sentinels():
     )
     expected_data = pd.DataFrame(
         data={
-            '@vrt.x02.motion_state': [False, None, True],
+            '@vrt.x02.motion_state': pd.array(
+                [False, None, True], dtype='boolean'),
             '@vrt.x03.motion_amount': [np.inf, np.nan, np.nan],
         },
-        index=pd.Series(
-            data=[
+        index=pd.DatetimeIndex(
+            [
                 pd.to_datetime('2018-03-21T15:45:00+10:00'),
                 pd.to_datetime('2018-03-21T15:50:00+10:00'),
                 pd.to_datetime('2018-03-21T15:55:00+10:00'),
             ],
             name='ts',
-        ),
+        ).tz_convert('Etc/GMT-10'),
     )
     expected = zincio.Grid(
         version=3,
@@ -452,20 +461,21 @@ def test_parse_kitchen_sink_data():
         data={
             '@point.location "LatLng"': [coord, coord, coord, coord],
             '@point.temp': [65.972, -13.232, 85.103, 44.072],
-            '@point.boolean': [True, False, None, True],
+            '@point.boolean': pd.array(
+                [True, False, None, True], dtype='boolean'),
             '@point.sometimes_inf_nan': [
                 0.00234, float("inf"), np.nan, np.nan,
             ],
         },
-        index=pd.Series(
-            data=[
+        index=pd.DatetimeIndex(
+            [
                 pd.to_datetime('2020-05-18T03:00:00-07:00'),
                 pd.to_datetime('2020-05-18T03:05:00-07:00'),
                 pd.to_datetime('2020-05-18T03:10:00-07:00'),
                 pd.to_datetime('2020-05-18T03:15:00-07:00'),
             ],
             name='ts',
-        ),
+        ).tz_convert('Etc/GMT-8'),
     )
     expected = zincio.Grid(
         version=3,
@@ -474,3 +484,470 @@ def test_parse_kitchen_sink_data():
         data=expected_data)
     actual = zincio.parse(s)
     assert_grid_equal(actual, expected)
+
+
+def test_read_zinc_regex_tokenizer_same_as_char():
+    for path in (FULL_GRID_FILE, HISREAD_SERIES_FILE, MINIMAL_COLINFO_FILE):
+        expected = zincio.read(path)
+        actual = zincio.read(path, tokenizer='regex')
+        assert_grid_equal(actual, expected)
+
+
+def test_parse_simple_rows_same_as_tokenized_rows():
+    header = ('ver:"3.0"\n'
+              'ts,v0 unit:"°F",v1,v2\n')
+    rows = ['2020-05-18T00:00:00-07:00 Los_Angeles,68.554°F,T,-1_000',
+            '2020-05-18T00:05:00-07:00 Los_Angeles,,N,2.5E-3',
+            '2020-05-18T00:10:00-07:00 Los_Angeles,-69.1°F,F,NA']
+    simple = zincio.parse(header + '\r\n'.join(rows))
+    # Leading whitespace in a cell sends the row through the tokenizer
+    tokenized = zincio.parse(header + '\n'.join(
+        row.replace(',', ', ') for row in rows) + '\n')
+    assert_grid_equal(simple, tokenized)
+    assert list(simple.data['v1']) == [True, pd.NA, False]
+
+
+def test_parse_bytes_without_decoding():
+    expected = zincio.read(FULL_GRID_FILE)
+    with open(FULL_GRID_FILE, 'rb') as f:
+        raw = f.read()
+    assert_grid_equal(zincio.parse(raw), expected)
+    assert_grid_equal(zincio.parse(memoryview(raw)), expected)
+    assert_grid_equal(zincio.read(io.BytesIO(raw)), expected)
+    assert_grid_equal(zincio.parse(raw, tokenizer='char'), expected)
+
+
+def test_read_zinc_mmap_same_as_stream():
+    expected = zincio.read(FULL_GRID_FILE)
+    assert_grid_equal(zincio.read(FULL_GRID_FILE, mmap=True), expected)
+    with open(FULL_GRID_FILE, 'rb') as f:
+        assert_grid_equal(zincio.read(f, mmap=True), expected)
+    # Falls back to reading in blocks when there is no file to map
+    with open(FULL_GRID_FILE, 'rb') as f:
+        raw = f.read()
+    assert_grid_equal(zincio.read(io.BytesIO(raw), mmap=True), expected)
+    assert_grid_equal(
+        zincio.read(io.StringIO(raw.decode()), mmap=True), expected)
+
+
+def test_iter_rows_same_as_read():
+    expected = zincio.read(HISREAD_SERIES_FILE)
+    it = zincio.iter_rows(HISREAD_SERIES_FILE)
+    header = next(it)
+    assert isinstance(header, zincio.GridHeader)
+    assert header.version == expected.version
+    assert header.grid_info == expected.grid_info
+    assert list(header.column_info) == ['ts', 'val']
+    rows = list(it)
+    assert len(rows) == len(expected.data)
+    assert all(isinstance(row, tuple) and len(row) == 2 for row in rows)
+    assert rows[0][0].value == expected.data.index[0]
+    assert rows[-1][0].value == expected.data.index[-1]
+
+
+def test_iter_rows_error_grid():
+    with pytest.raises(zincio.ZincErrorGridException):
+        next(zincio.iter_rows(io.StringIO(
+            'ver:"3.0" err dis:"Error"\nempty\n')))
+
+
+def test_read_zinc_chunksize_same_as_read():
+    expected = zincio.read(HISREAD_SERIES_FILE)
+    chunks = list(zincio.read(HISREAD_SERIES_FILE, chunksize=2))
+    assert [len(c.data) for c in chunks] == [2, 1]
+    for chunk in chunks:
+        assert chunk.grid_info == expected.grid_info
+        assert chunk.column_info == expected.column_info
+    pd.testing.assert_frame_equal(
+        pd.concat([c.data for c in chunks]), expected.data)
+    # A single chunk when chunksize exceeds the number of rows
+    chunks = list(zincio.read(HISREAD_SERIES_FILE, chunksize=100))
+    assert len(chunks) == 1
+    assert_grid_equal(chunks[0], expected)
+    with pytest.raises(ValueError):
+        zincio.read(HISREAD_SERIES_FILE, chunksize=0)
+
+
+def test_read_zinc_usecols():
+    full = zincio.read(FULL_GRID_FILE)
+    names = list(full.column_info)
+    ref = full.column_info[names[2]]['id']
+    expected = full.data[[str(ref)]]
+    for usecols in ([names[2]], [ref], ['@' + ref.uid], [str(ref)]):
+        grid = zincio.read(FULL_GRID_FILE, usecols=usecols)
+        assert list(grid.column_info) == ['ts', names[2]]
+        pd.testing.assert_frame_equal(grid.data, expected)
+    # Same for rows that go through the tokenizer
+    with open(FULL_GRID_FILE) as f:
+        lines = f.read().split('\n')
+    text = '\n'.join(
+        lines[:2] + [line.replace(',', ', ') for line in lines[2:]])
+    grid = zincio.parse(text, usecols=[ref])
+    pd.testing.assert_frame_equal(grid.data, expected)
+    with pytest.raises(ValueError):
+        zincio.read(FULL_GRID_FILE, usecols=['nonexistent'])
+
+
+def test_read_zinc_time_range():
+    full = zincio.read(FULL_GRID_FILE)
+    start = pd.Timestamp('2020-05-17T23:55:00-07:00')
+    end = pd.Timestamp('2020-05-18T07:05:00Z')
+    # The first and last rows hold strings, so go through the tokenizer
+    expected = full.data[start:end.tz_convert(start.tz)]
+    assert len(expected) == 3
+    grid = zincio.read(FULL_GRID_FILE, start=start, end=end)
+    pd.testing.assert_frame_equal(
+        grid.data, expected, check_dtype=False)
+    grid = zincio.read(FULL_GRID_FILE, start=start, end=end, tokenizer='regex')
+    pd.testing.assert_frame_equal(
+        grid.data, expected, check_dtype=False)
+    # Open-ended ranges
+    grid = zincio.read(FULL_GRID_FILE, start=end)
+    pd.testing.assert_frame_equal(
+        grid.data, full.data[end.tz_convert(start.tz):], check_dtype=False)
+    grid = zincio.read(FULL_GRID_FILE, end=start)
+    pd.testing.assert_frame_equal(
+        grid.data, full.data[:start], check_dtype=False)
+
+
+def test_read_zinc_time_range_stops_reading_after_end():
+    with open(FULL_GRID_FILE) as f:
+        lines = f.read().split('\n')
+    # The trailing garbage would fail the parse if it were read
+    text = '\n'.join(lines[:4] + ['!!garbage!!'])
+    grid = zincio.parse(text, end='2020-05-18T06:50:00')
+    assert len(grid.data) == 1
+
+
+def test_read_meta_same_as_read():
+    expected = zincio.read(FULL_GRID_FILE)
+    for tokenizer in (None, 'regex'):
+        header = zincio.read_meta(FULL_GRID_FILE, tokenizer=tokenizer)
+        assert header.version == expected.version
+        assert header.grid_info == expected.grid_info
+        assert header.column_info == expected.column_info
+
+
+def test_read_meta_does_not_read_rows():
+    with open(FULL_GRID_FILE) as f:
+        lines = f.read().split('\n')
+    header = zincio.read_meta(io.StringIO('\n'.join(lines[:2] + ['!!'])))
+    assert len(header.column_info) == 6
+
+
+def test_read_zinc_workers_same_as_serial():
+    for path in (FULL_GRID_FILE, HISREAD_SERIES_FILE):
+        expected = zincio.read(path)
+        for workers in (2, 3, 8):
+            assert_grid_equal(zincio.read(path, workers=workers), expected)
+    with open(FULL_GRID_FILE, 'rb') as f:
+        raw = f.read()
+    expected = zincio.read(FULL_GRID_FILE, usecols=['v1'])
+    assert_grid_equal(
+        zincio.read(io.BytesIO(raw), workers=2, usecols=['v1']), expected)
+    with pytest.raises(ValueError):
+        zincio.read(FULL_GRID_FILE, workers=2, chunksize=2)
+
+
+def test_read_zinc_workers_convert_all_rows_at_once(tmp_path):
+    # Offsets crossing DST in an unknown tz, and Bools with nulls only in
+    # the first rows, each give the whole column the same dtype as serially
+    path = tmp_path / 'dst.zinc'
+    path.write_text(
+        'ver:"3.0"\nts,v0 kind:"Bool",v1\n' + ''.join(
+            f'2020-03-08T{h:02}:00:00{"-08:00" if h < 3 else "-07:00"} '
+            f'Nowhere,{"N" if h < 2 else "T"},{"N" if h < 2 else "F"}\n'
+            for h in range(0, 24)))
+    expected = zincio.read(path)
+    assert str(expected.data.index.tz) == 'UTC'
+    assert expected.data['v0'].dtype == 'boolean'
+    for workers in (2, 3):
+        for tokenizer in ('char', 'regex'):
+            assert_grid_equal(
+                zincio.read(path, tokenizer, workers=workers), expected)
+
+
+def test_read_zinc_workers_from_bytes_path_and_fd():
+    expected = zincio.read(FULL_GRID_FILE)
+    path = os.fsencode(FULL_GRID_FILE)
+    assert_grid_equal(zincio.read(path, workers=2), expected)
+    fd = os.open(FULL_GRID_FILE, os.O_RDONLY)
+    assert_grid_equal(zincio.read(fd, workers=2), expected)
+
+
+def test_split_rows_skips_quoted_newlines():
+    data = (b'ver:"3.0"\n'
+            b'ts,v0\n'
+            b'2020-05-18T00:00:00Z,"a\nb"\n'
+            b'2020-05-18T00:05:00Z,`c\nd`\n'
+            b'2020-05-18T00:10:00Z,"e"\n')
+    bounds = zinc_parser._split_rows(data, 8)
+    rows = [data[a:b] for a, b in zip(bounds, bounds[1:])]
+    assert rows == [
+        b'2020-05-18T00:00:00Z,"a\nb"\n',
+        b'2020-05-18T00:05:00Z,`c\nd`\n',
+        b'2020-05-18T00:10:00Z,"e"\n']
+
+
+def test_read_many_same_as_read(tmp_path):
+    bad = tmp_path / "bad.zinc"
+    bad.write_text('ver:"3.0"\n!!\n')
+    err = tmp_path / "err.zinc"
+    err.write_text('ver:"3.0" err dis:"Error"\nempty\n')
+    unterminated = tmp_path / "unterminated.zinc"
+    unterminated.write_text('ver:"3.0"\nts,v0\n2020-05-18T00:00:00Z,"a')
+    paths = [FULL_GRID_FILE, bad, SINGLE_SERIES_FILE, err, unterminated]
+    results = zincio.read_many(paths, workers=2)
+    assert list(results) == paths
+    assert_grid_equal(results[FULL_GRID_FILE], zincio.read(FULL_GRID_FILE))
+    assert_grid_equal(
+        results[SINGLE_SERIES_FILE], zincio.read(SINGLE_SERIES_FILE))
+    assert isinstance(results[bad], zincio.ZincParseException)
+    assert isinstance(results[err], zincio.ZincErrorGridException)
+    assert isinstance(results[unterminated], ZincTokenizerException)
+    completed = dict(zincio.read_many(paths, workers=2, as_completed=True))
+    assert completed.keys() == results.keys()
+    with open(FULL_GRID_FILE) as f:
+        with pytest.raises(TypeError):
+            zincio.read_many([FULL_GRID_FILE, f])
+
+
+def read_async_in_chunks(raw, chunk_size, **kwargs):
+    async def read():
+        reader = asyncio.StreamReader()
+        for i in range(0, len(raw), chunk_size):
+            reader.feed_data(raw[i:i + chunk_size])
+        reader.feed_eof()
+        return await zincio.read_async(reader, **kwargs)
+    return asyncio.run(read())
+
+
+def test_read_async_same_as_read():
+    expected = zincio.read(FULL_GRID_FILE)
+    with open(FULL_GRID_FILE, 'rb') as f:
+        raw = f.read()
+    for chunk_size in (1, 2, 7, 64, len(raw)):
+        assert_grid_equal(read_async_in_chunks(raw, chunk_size), expected)
+    # Newlines, commas and escaped quotes inside strings, and commas inside
+    # URIs, split across chunks
+    raw = (b'ver:"3.0"\n'
+           b'ts,v0,v1\n'
+           b'2020-05-18T00:00:00Z,"a\n\\"b,",`c,d`\n'
+           b'2020-05-18T00:05:00Z,"e",`f`')
+    expected = zincio.parse(raw)
+    for chunk_size in (1, 3, 5):
+        assert_grid_equal(read_async_in_chunks(raw, chunk_size), expected)
+
+
+def test_feed_parser_same_as_parse():
+    raw = ('ver:"3.0"\n'
+           'ts,v0 unit:"°F",v1\n'
+           '2020-05-18T00:00:00-07:00 Los_Angeles,68.554°F,"a\\nb"\n'
+           '2020-05-18T00:05:00-07:00 Los_Angeles,-1_000°F,"ü,\n"\n'
+           '2020-05-18T00:10:00-07:00 Los_Angeles,2.5E-3°F,N\n').encode()
+    expected = zincio.parse(raw)
+    # Split everywhere, including within strings, numbers, timezones and
+    # multi-byte characters
+    for i in range(len(raw) + 1):
+        parser = zincio.ZincFeedParser()
+        parser.feed(raw[:i])
+        parser.feed(raw[i:])
+        assert_grid_equal(parser.close(), expected)
+    with pytest.raises(ValueError):
+        parser.feed(raw)
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+@pytest.mark.parametrize('rows,valid', [
+    ('2020-05-18T00:00:00Z,1\n\n', True),
+    ('2020-05-18T00:00:00Z,1\n\n\n', False),
+    ('2020-05-18T00:00:00Z,1\n\n2020-05-18T00:05:00Z,2\n', False),
+    ('\n\n', False),
+])
+def test_feed_parser_checks_end_as_parse(rows, valid):
+    raw = ('ver:"3.0"\nts,v0\n' + rows).encode()
+    for i in range(len(raw) + 1):
+        parser = zincio.ZincFeedParser()
+        if valid:
+            parser.feed(raw[:i])
+            parser.feed(raw[i:])
+            assert_grid_equal(parser.close(), zincio.parse(raw))
+        else:
+            with pytest.raises(zincio.ZincParseException):
+                parser.feed(raw[:i])
+                parser.feed(raw[i:])
+                parser.close()
+
+
+def test_parse_ts_index_is_utc_backed_in_column_tz():
+    for stamps in (
+            ['2020-03-08T01:00:00-08:00', '2020-03-08T03:00:00-07:00'],
+            ['2020-05-18T00:00:00Z', '2020-05-18T00:00:01.5Z'],
+            ['2020-05-18T00:00-07:00', '2020-05-18T00:05-07:00'],
+            ['2020-05-18T00:00:00-07:00', '2020-05-18T00:05:00-07:00']):
+        grid = zincio.parse('ver:"3.0"\nts,v0\n' + ''.join(
+            f'{ts} Los_Angeles,{i}\n' for i, ts in enumerate(stamps)))
+        expected = pd.DatetimeIndex(
+            pd.to_datetime(stamps, utc=True), name='ts')
+        pd.testing.assert_index_equal(
+            grid.data.index, expected.tz_convert('America/Los_Angeles'))
+    # The column's tz takes precedence. Unknown ones keep the UTC offset of
+    # the rows, or leave the index in UTC if the offsets differ
+    grid = zincio.parse('ver:"3.0"\nts tz:"New_York",v0\n'
+                        '2020-05-18T00:00:00-07:00 Los_Angeles,1\n')
+    assert str(grid.data.index.tz) == 'America/New_York'
+    grid = zincio.parse('ver:"3.0"\nts,v0\n'
+                        '2020-05-18T00:00:00-05:00 Nowhere,1\n'
+                        '2020-05-18T00:05:00-05:00 Nowhere,2\n')
+    assert [ts.isoformat() for ts in grid.data.index] == [
+        '2020-05-18T00:00:00-05:00', '2020-05-18T00:05:00-05:00']
+    assert grid.data.index.tz.utcoffset(None) == datetime.timedelta(hours=-5)
+    grid = zincio.parse('ver:"3.0"\nts,v0\n'
+                        '2020-05-18T00:00:00-05:00 Nowhere,1\n'
+                        '2020-05-18T00:05:00-04:00 Nowhere,2\n')
+    assert str(grid.data.index.tz) == 'UTC'
+
+
+def test_parse_null_ts_to_nat():
+    raw = ('ver:"3.0"\nts,v0\n'
+           'N,1\n'
+           '2020-05-18T00:00:00-05:00 Chicago,2\n'
+           'N,3\n'
+           '2020-05-18T00:10:00-05:00 Chicago,4\n')
+    expected = pd.DatetimeIndex(
+        [pd.NaT, '2020-05-18T05:00:00Z', pd.NaT, '2020-05-18T05:10:00Z'],
+        name='ts').tz_convert('America/Chicago')
+    for tokenizer in ('char', 'regex'):
+        grid = zincio.parse(raw, tokenizer)
+        pd.testing.assert_index_equal(grid.data.index, expected)
+        assert list(grid.data['v0']) == [1, 2, 3, 4]
+    idx = zincio.grid._datetime_index(
+        [zincio.NULL, zincio.Datetime(
+            pd.Timestamp('2020-05-18T00:00:00-05:00'), 'Chicago')], {})
+    pd.testing.assert_index_equal(idx, expected[:2].rename(None))
+    grid = zincio.parse('ver:"3.0"\nts,v0\nN,1\n')
+    assert grid.data.index.isna().all()
+
+
+def test_parse_column_decoders_fall_back_on_mismatch():
+    header = ('ver:"3.0"\n'
+              'ts,v0 kind:"Number" unit:"°F",v1 kind:"Bool",'
+              'v2 kind:"Number"\n')
+    rows = ['2020-05-18T00:00:00-07:00 Los_Angeles,68.5°F,T,1_000',
+            '2020-05-18T00:05:00-07:00 Los_Angeles,20°C,N,2.5E-3',
+            '2020-05-18T00:10:00-07:00 Los_Angeles,NaN,F,-3%',
+            '2020-05-18T00:15:00-07:00 Los_Angeles,,,']
+    rows = list(zincio.iter_rows(io.StringIO(header + '\n'.join(rows))))[1:]
+    assert [row[1:] for row in rows] == [
+        (zincio.Number(68.5, '°F'), zincio.dtypes.BOOL_TRUE,
+         zincio.Number(1000)),
+        (zincio.Number(20, '°C'), zincio.NULL, zincio.Number(0.0025)),
+        (zincio.NAN, zincio.dtypes.BOOL_FALSE, zincio.Number(-3, '%')),
+        (zincio.NULL, zincio.NULL, zincio.NULL)]
+
+
+def test_parse_number_columns_to_typed_arrays():
+    grid = zincio.parse(
+        'ver:"3.0"\n'
+        'ts,v0 kind:"Number" unit:"kW",v1 kind:"Number",v2 kind:"Number"\n'
+        '2020-05-18T00:00:00-07:00 Los_Angeles,1kW,1.5,"12"\n'
+        '2020-05-18T00:05:00-07:00 Los_Angeles,2kW,N,3\n'
+        '2020-05-18T00:10:00-07:00 Los_Angeles,3W,NaN,4.5\n')
+    df = grid.data
+    assert df['v0'].dtype == np.int64
+    assert list(df['v0']) == [1, 2, 3]
+    assert df['v1'].dtype == np.float64
+    np.testing.assert_array_equal(df['v1'], [1.5, np.nan, np.nan])
+    # A String in a Number column is converted as before
+    assert list(df['v2']) == [12, 3, 4.5]
+    # Integers too large for int64 are converted as by pd.to_numeric: kept
+    # exact as uint64 if they fit, or else as float64
+    exact = zincio.parse(
+        'ver:"3.0"\n'
+        'ts,v0 kind:"Number"\n'
+        '2020-05-18T00:00:00-07:00 Los_Angeles,1\n'
+        '2020-05-18T00:05:00-07:00 Los_Angeles,12345678901234567890\n')
+    assert exact.data['v0'].dtype == np.uint64
+    assert list(exact.data['v0']) == [1, 12345678901234567890]
+    big = zincio.parse(
+        'ver:"3.0"\n'
+        'ts,v0 kind:"Number",v1 kind:"Number"\n'
+        '2020-05-18T00:00:00-07:00 Los_Angeles,1,1\n'
+        '2020-05-18T00:05:00-07:00 Los_Angeles,99999999999999999999,"2"\n'
+        '2020-05-18T00:10:00-07:00 Los_Angeles,3,99999999999999999999\n')
+    assert big.data['v0'].dtype == np.float64
+    assert list(big.data['v0']) == [1.0, 1e20, 3.0]
+    assert big.data['v1'].iloc[2] == 1e20
+    chunks = zincio.read(
+        io.StringIO(grid.to_zinc()), chunksize=2)
+    assert [len(chunk.data) for chunk in chunks] == [2, 1]
+
+
+def test_parse_bool_columns_to_bool_dtype():
+    grid = zincio.parse(
+        'ver:"3.0"\n'
+        'ts,v0 kind:"Bool",v1 kind:"Bool",v2\n'
+        '2020-05-18T00:00:00-07:00 Los_Angeles,T,T,F\n'
+        '2020-05-18T00:05:00-07:00 Los_Angeles,F,N,T\n')
+    df = grid.data
+    assert df['v0'].dtype == np.bool_
+    assert list(df['v0']) == [True, False]
+    assert df['v1'].dtype == 'boolean'
+    assert list(df['v1']) == [True, pd.NA]
+    assert df['v2'].dtype == np.bool_
+
+
+@pytest.mark.parametrize('suffix,compression', [
+    ('.gz', 'gzip'), ('.bz2', 'bz2'), ('.xz', 'xz')])
+def test_read_compressed(tmp_path, suffix, compression):
+    expected = zincio.read(FULL_GRID_FILE)
+    path = tmp_path / ('grid.zinc' + suffix)
+    with open(FULL_GRID_FILE, 'rb') as f:
+        raw = f.read()
+    with compression_module.COMPRESSIONS[compression](path, 'wb') as f:
+        f.write(raw)
+    assert_grid_equal(zincio.read(path), expected)
+    assert_grid_equal(
+        zincio.read(path, tokenizer='regex', mmap=True), expected)
+    assert_grid_equal(zincio.read(path, workers=2), expected)
+    chunks = zincio.read(path, chunksize=100)
+    assert sum(len(c.data) for c in chunks) == len(expected.data)
+    assert zincio.read_meta(path).column_info == expected.column_info
+    with open(path, 'rb') as f:
+        assert_grid_equal(
+            zincio.read(f, compression=compression), expected)
+
+
+def test_read_unknown_compression():
+    with pytest.raises(ValueError):
+        zincio.read(FULL_GRID_FILE, compression='zip')
+
+
+@pytest.mark.parametrize('cell', [
+    '0x1f', '0X1F', '-0x1f', '10x', '00x1', '0', '-1_000', '2.5E-3', '1e5',
+    '68.554°F', '-3%', '5min', 'N', 'M', 'NA', 'NaN', 'INF', 'T', 'F',
+    '2020-05-18T00:00:00-07:00 Los_Angeles', '2020-05-18T00:00:00Z'])
+def test_decode_simple_cell_same_as_tokenized(cell):
+    simple = zinc_parser._decode_simple_cell(cell)
+    try:
+        # Leading whitespace sends the row through the tokenizer
+        rows = zincio.iter_rows(io.StringIO('ver:"3.0"\nv\n ' + cell + '\n'))
+        tokenized = list(rows)[1][0]
+    except (zincio.ZincParseException, ZincTokenizerException):
+        assert simple is None
+        return
+    assert simple is None or simple == tokenized
+
+
+def test_read_chunks_keep_kinds_of_first_chunk():
+    s = ('ver:"3.0"\nts,v\n'
+         '2020-05-18T00:00:00Z UTC,0\n'
+         '2020-05-18T00:05:00Z UTC,1\n'
+         '2020-05-18T00:10:00Z UTC,\n'
+         '2020-05-18T00:15:00Z UTC,\n')
+    chunks = list(zincio.read(io.StringIO(s), chunksize=2))
+    assert [len(chunk.data) for chunk in chunks] == [2, 2]
+    assert list(chunks[0].data['v']) == [0, 1]
+    assert chunks[1].data['v'].dtype == np.float64
+    assert chunks[1].data['v'].isna().all()
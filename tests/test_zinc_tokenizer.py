@@ -1,10 +1,39 @@
+import io
+import pytest  # type: ignore
+
+from pathlib import Path
 from zincio import tokens
-from zincio.zinc_tokenizer import tokenize
+from zincio import zinc_tokenizer
+from zincio.zinc_tokenizer import (
+    TOKENIZERS,
+    ZincBytesTokenizer,
+    ZincTokenizerException,
+)
 from zincio.tokens import NumberToken, TokenType, Token
 
 
-def test_tokenize_datetime_with_tz():
-    actual = list(tokenize("2020-05-17T23:47:08-07:00 Los_Angeles,"))
+def get_abspath(relpath):
+    return Path(__file__).parent / relpath
+
+
+FULL_GRID_FILE = get_abspath("full_grid.zinc")
+
+
+@pytest.fixture(params=sorted(TOKENIZERS) + ['bytes'])
+def tokenizer(request):
+    return request.param
+
+
+def tokenize(s, tokenizer=None):
+    # 'bytes' runs the regex engine over the UTF-8 encoded input
+    if tokenizer == 'bytes':
+        return zinc_tokenizer.tokenize(s.encode(), 'regex')
+    return zinc_tokenizer.tokenize(s, tokenizer)
+
+
+def test_tokenize_datetime_with_tz(tokenizer):
+    s = "2020-05-17T23:47:08-07:00 Los_Angeles,"
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.DATETIME, "2020-05-17T23:47:08-07:00 Los_Angeles"),
         tokens.COMMA,
@@ -13,8 +42,8 @@ def test_tokenize_datetime_with_tz():
     assert actual == expected
 
 
-def test_tokenize_datetime_utc():
-    actual = list(tokenize('mod:2020-03-23T23:36:40.343Z his'))
+def test_tokenize_datetime_utc(tokenizer):
+    actual = list(tokenize('mod:2020-03-23T23:36:40.343Z his', tokenizer))
     expected = [
         Token(TokenType.ID, 'mod'),
         tokens.COLON,
@@ -25,15 +54,15 @@ def test_tokenize_datetime_utc():
     assert actual == expected
 
 
-def test_tokenize_uri():
-    actual = list(tokenize("`http://www.example.org`"))
+def test_tokenize_uri(tokenizer):
+    actual = list(tokenize("`http://www.example.org`", tokenizer))
     expected = [Token(TokenType.URI, "http://www.example.org"), tokens.EOF]
     assert actual == expected
 
 
-def test_tokenize_ref_with_name():
+def test_tokenize_ref_with_name(tokenizer):
     s = 'id:@p:q01b001:r:0197767d-c51944e4 "Building One VAV1-01 Eff Heat SP"'
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'id'),
         tokens.COLON,
@@ -46,9 +75,9 @@ def test_tokenize_ref_with_name():
     assert actual == expected
 
 
-def test_tokenize_ref_without_name():
+def test_tokenize_ref_without_name(tokenizer):
     s = 'id:@p:q01b001:r:0197767d-c51944e4 nextTag'
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'id'),
         tokens.COLON,
@@ -59,9 +88,9 @@ def test_tokenize_ref_without_name():
     assert actual == expected
 
 
-def test_tokenize_row_with_units():
+def test_tokenize_row_with_units(tokenizer):
     s = '2020-05-17T23:55:00-07:00 Los_Angeles,68.553°F'
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.DATETIME, '2020-05-17T23:55:00-07:00 Los_Angeles'),
         tokens.COMMA,
@@ -71,11 +100,11 @@ def test_tokenize_row_with_units():
     assert actual == expected
 
 
-def test_tokenize_long_string_valued_tag():
+def test_tokenize_long_string_valued_tag(tokenizer):
     s = ('actions:'
          '"ver:\\"3.0\\"\\ndis,expr\\n\\"Override\\",\\"pointOverride(\\$self,'
          ' \\$val, \\$duration)\\"\\n\\"Auto\\",\\"pointAuto(\\$self)\\"\\n"')
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'actions'),
         tokens.COLON,
@@ -90,9 +119,9 @@ def test_tokenize_long_string_valued_tag():
     assert actual == expected
 
 
-def test_tokenize_multiple_lines():
+def test_tokenize_multiple_lines(tokenizer):
     s = 'ts,val\n2020-05-17T23:47:08-07:00 Los_Angeles,\n\n'
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'ts'),
         tokens.COMMA,
@@ -107,13 +136,13 @@ def test_tokenize_multiple_lines():
     assert actual == expected
 
 
-def test_tokenize_sentinels_in_values():
+def test_tokenize_sentinels_in_values(tokenizer):
     s = ('ver:"3.0" hisEnd:M hisStart:M\n'
          'ts,v0 id:@vrt.x02.motion_state,v1 id:@vrt.x03.motion_amount\n'
          '2018-03-21T15:45:00+10:00 GMT-10,F,INF\n'
          '2018-03-21T15:50:00+10:00 GMT-10,N,NA\n'
          '2018-03-21T15:55:00+10:00 GMT-10,T,NaN\n\n')
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'ver'),
         tokens.COLON,
@@ -161,11 +190,11 @@ def test_tokenize_sentinels_in_values():
     assert actual == expected
 
 
-def test_tokenize_coords():
+def test_tokenize_coords(tokenizer):
     s = ('ver:"3.0" hisStart:2020-05-18T03:00:00-07:00 Los_Angeles\n'
          'ts,v0 id:@somepoint\n'
          '2020-05-18T03:00:00-07:00 Los_Angeles,C(37.427539, -122.170244)\n\n')
-    actual = list(tokenize(s))
+    actual = list(tokenize(s, tokenizer))
     expected = [
         Token(TokenType.ID, 'ver'),
         tokens.COLON,
@@ -189,3 +218,35 @@ def test_tokenize_coords():
         tokens.EOF,
     ]
     assert actual == expected
+
+
+def test_tokenize_across_block_boundaries(tokenizer):
+    with open(FULL_GRID_FILE, encoding='utf-8') as f:
+        s = f.read()
+    expected = list(tokenize(s))
+    for chunk_size in (1, 2, 3, 7, 64):
+        if tokenizer == 'bytes':
+            tkzr = ZincBytesTokenizer(
+                io.BytesIO(s.encode()), chunk_size=chunk_size)
+        else:
+            tkzr = TOKENIZERS[tokenizer](
+                io.StringIO(s), chunk_size=chunk_size)
+        actual = []
+        while True:
+            tok = next(tkzr)
+            actual.append(tok)
+            if tok is tokens.EOF:
+                break
+        assert actual == expected
+        assert tkzr.line == s.count('\n')
+
+
+def test_tokenize_unterminated_str(tokenizer):
+    with pytest.raises(ZincTokenizerException):
+        list(tokenize('dis:"Building One', tokenizer))
+
+
+def test_tokens_have_no_instance_dict(tokenizer):
+    s = '2020-05-17T23:55:00-07:00 Los_Angeles,68.553°F'
+    for tok in tokenize(s, tokenizer):
+        assert not hasattr(tok, '__dict__')
@@ -0,0 +1,78 @@
+import io
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+import zincio
+from pathlib import Path
+
+
+def get_abspath(relpath):
+    return Path(__file__).parent / relpath
+
+
+SINGLE_SERIES_FILE = get_abspath("single_series_grid.zinc")
+
+
+def test_write_rows_same_as_to_zinc():
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    f = io.StringIO()
+    writer = zincio.ZincWriter(
+        f, grid.grid_info, grid.column_info, version=grid.version)
+    writer.write_rows(grid.data.iloc[:2])
+    writer.write_rows(grid.data.iloc[2:])
+    assert f.getvalue() == grid.to_zinc()
+
+
+def test_write_rows_converts_index_to_column_tz():
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    for idx in (grid.data.index.tz_convert('UTC'),
+                grid.data.index.tz_convert(None)):
+        f = io.StringIO()
+        writer = zincio.ZincWriter(
+            f, grid.grid_info, grid.column_info, version=grid.version)
+        writer.write_rows(grid.data.set_axis(idx))
+        assert f.getvalue() == grid.to_zinc()
+        actual = zincio.read(io.StringIO(f.getvalue()))
+        pd.testing.assert_frame_equal(actual.data, grid.data)
+
+
+def test_write_row_buffers_until_flush():
+    grid = zincio.read(SINGLE_SERIES_FILE)
+    f = io.StringIO()
+    writer = zincio.ZincWriter(
+        f, grid.grid_info, grid.column_info, version=grid.version)
+    header = f.getvalue()
+    for ts, value in grid.to_pandas().items():
+        writer.write_row(ts, [value])
+    assert f.getvalue() == header
+    writer.flush()
+    assert f.getvalue() == grid.to_zinc()
+
+
+def test_write_row_in_column_tz():
+    f = io.StringIO()
+    writer = zincio.ZincWriter(
+        f, {}, {'ts': {'tz': zincio.String('Los_Angeles')},
+                'v0': {'unit': zincio.String('kW')}},
+        buffer_rows=2)
+    writer.write_row(pd.Timestamp('2020-11-01T08:30:00Z'), [1.5])
+    writer.write_row('2020-11-01T09:30:00Z', [None])
+    writer.write_row(pd.Timestamp('2020-11-01T10:30:00Z'), [2.5])
+    assert f.getvalue().count('\n') == 4
+    writer.flush()
+    assert f.getvalue() == (
+        'ver:"3.0"\n'
+        'ts tz:"Los_Angeles",v0 unit:"kW"\n'
+        '2020-11-01T01:30:00-07:00 Los_Angeles,1.5kW\n'
+        '2020-11-01T01:30:00-08:00 Los_Angeles,\n'
+        '2020-11-01T02:30:00-08:00 Los_Angeles,2.5kW\n')
+
+
+def test_writer_rejects_mismatched_rows():
+    writer = zincio.ZincWriter(io.StringIO(), {}, {'ts': {}, 'v0': {}})
+    with pytest.raises(ValueError):
+        writer.write_row(pd.Timestamp('2020-11-01'), [1, 2])
+    with pytest.raises(ValueError):
+        writer.write_rows(pd.DataFrame(
+            {'a': [1], 'b': [2]}, index=pd.DatetimeIndex(['2020-11-01'])))
+    with pytest.raises(ValueError):
+        zincio.ZincWriter(io.StringIO(), {}, {'v0': {}})
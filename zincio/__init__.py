@@ -11,13 +11,19 @@ from .dtypes import (
     String,
     Uri,
 )
-from .grid import Grid
+from .grid import Grid, GridHeader
 from .zinc_parser import (
+    iter_rows,
     parse,
     read,
+    read_async,
+    read_many,
+    read_meta,
     ZincErrorGridException,
+    ZincFeedParser,
     ZincParseException,
 )
+from .zinc_writer import ZincWriter
 
 __all__ = [
     'NULL',
@@ -32,8 +38,15 @@ __all__ = [
     'String',
     'Uri',
     'Grid',
+    'GridHeader',
+    'iter_rows',
     'parse',
     'read',
+    'read_async',
+    'read_many',
+    'read_meta',
     'ZincParseException',
     'ZincErrorGridException',
+    'ZincFeedParser',
+    'ZincWriter',
 ]
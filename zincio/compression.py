@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+import os
+
+from os import PathLike
+from typing import Any, Callable, Dict, IO, Optional
+
+
+# Openers of compressed files, by name of compression
+COMPRESSIONS: Dict[str, Callable[..., IO]] = {
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'xz': lzma.open,
+}
+
+_SUFFIXES = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+}
+
+
+def _infer_compression(
+        filepath_or_buffer: Any, compression: Optional[str]) -> Optional[str]:
+    """Resolves compression='infer' from the suffix of a file path.
+
+    Buffers are never inferred to be compressed.
+    """
+    if compression == 'infer':
+        if not isinstance(filepath_or_buffer, (str, PathLike)):
+            return None
+        path = os.fspath(filepath_or_buffer)
+        if not isinstance(path, str):
+            return None
+        return _SUFFIXES.get(os.path.splitext(path)[1].lower())
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Unknown compression {compression}; expected one of "
+            f"{', '.join(COMPRESSIONS)}, 'infer' or None")
+    return compression
+
+
+def _open_compressed(
+        filepath_or_buffer: Any, compression: str, mode: str) -> IO:
+    """Opens a path or binary buffer through the named decompressor.
+
+    Data is (de)compressed in blocks as it is read or written. A buffer is
+    left open when the returned file is closed.
+    """
+    if 't' in mode:
+        return COMPRESSIONS[compression](
+            filepath_or_buffer, mode, encoding='utf-8')
+    return COMPRESSIONS[compression](filepath_or_buffer, mode)
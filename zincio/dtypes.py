@@ -35,6 +35,11 @@ class SentinelScalar(Scalar):
     def __repr__(self) -> str:
         return type(self).__name__
 
+    def __reduce__(self) -> str:
+        # Unpickle as the module's instance (NULL, MARKER, ...), since the
+        # instances are compared by identity
+        return type(self).__name__.upper()
+
 
 class Null(SentinelScalar):
     """Type of the Zinc null indicator."""
@@ -72,9 +77,33 @@ BOOL_FALSE = Boolean(False)
 
 class Datetime(Scalar):
     def __init__(self, value: pd.Timestamp, tz: str = ''):
-        self.value: pd.Timestamp = value
+        self._value: Optional[pd.Timestamp] = value
+        # ISO 8601 text that value is parsed from, when first needed
+        self.iso: Optional[str] = None
         self.tz: str = tz
 
+    @classmethod
+    def from_iso(cls, iso: str, tz: str = '') -> 'Datetime':
+        """Creates a Datetime from ISO 8601 text, without parsing it yet.
+
+        Columns of such Datetimes can then be parsed all at once, rather
+        than one Timestamp at a time.
+        """
+        dt = cls(None, tz)
+        dt.iso = iso
+        return dt
+
+    @property
+    def value(self) -> pd.Timestamp:
+        if self._value is None:
+            self._value = pd.to_datetime(self.iso)
+        return self._value
+
+    @value.setter
+    def value(self, value: pd.Timestamp):
+        self._value = value
+        self.iso = None
+
     def __repr__(self):
         return f'{type(self).__name__}({self.value.isoformat()}, "{self.tz}")'
 
@@ -1,20 +1,34 @@
+import csv
+import datetime
+import functools
+import io
+import itertools
 import logging
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
+from array import array
 from os import PathLike
 from pandas.api.types import CategoricalDtype  # type: ignore
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any, Callable, cast, Dict, IO, Iterable, Iterator, List, Optional, Set,
+    Tuple, Union)
 
-from .dtypes import Boolean, Number, Scalar, String, MARKER, NULL, NA
+from .compression import _infer_compression, _open_compressed
+from .dtypes import Boolean, Datetime, Number, Scalar, String, MARKER, NULL, NA
 
 
 ID_COLTAG = 'id'
 KIND_COLTAG = 'kind'
 UNIT_COLTAG = 'unit'
 ENUM_COLTAG = 'enum'
+TZ_COLTAG = 'tz'
+
+# The int64 nanoseconds of NaT
+_NAT_NS = pd.NaT.value
 
 NUMBER_KIND = String("Number")
+BOOL_KIND = String("Bool")
 STRING_KIND = String("Str")
 
 
@@ -93,95 +107,305 @@ class Grid:
             return self.data[self.data.columns[0]]
         return self.data
 
-    def to_zinc(self, path: Optional[PathLike] = None) -> Optional[str]:
+    def to_zinc(
+            self,
+            path: Optional[Union[PathLike, IO[str]]] = None,
+            chunksize: Optional[int] = None,
+            compression: Optional[str] = 'infer') -> Optional[str]:
         """Writes the object to a Zinc-formatted file.
 
         Args:
             path: str or file handle, default None
                 File path or object. If None is provided, the result is
                 returned as a string. Otherwise, object is written to file.
+            chunksize: int, optional
+                Format and write the rows this many at a time, so that only
+                one chunk of formatted cells is held in memory, rather than
+                all of them. By default, all rows are formatted at once.
+            compression: str, default 'infer'
+                'gzip', 'bz2' or 'xz' to compress the output in blocks as it
+                is written, or None. 'infer' picks one from the suffix of a
+                path ('.gz', '.bz2' or '.xz'). A file handle given with a
+                compression must be binary.
         Returns:
-            The Zinc-formatted string representation of the grid if path is not
+            The Zinc-formatted string representation of the grid if path is
             None, otherwise None.
         """
-        if path is not None:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(self._grid_info_str())
-                f.write("\n")
-                f.write(self._column_info_str())
-                f.write("\n")
-                self._zinc_format_data().to_csv(f, mode="a", header=False)
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"chunksize must be positive, not {chunksize}")
+        if path is None:
+            buf = io.StringIO()
+            self._write_zinc(buf, chunksize)
+            return buf.getvalue()
+        compression = _infer_compression(path, compression)
+        if compression is not None:
+            with _open_compressed(path, compression, "wt") as f:
+                self._write_zinc(f, chunksize)
             return None
-        else:
-            return "\n".join([
-                self._grid_info_str(),
-                self._column_info_str(),
-                self._zinc_format_data().to_csv(header=False)
-            ])
+        if hasattr(path, 'write'):
+            self._write_zinc(path, chunksize)  # type: ignore
+            return None
+        with open(path, "w", encoding="utf-8") as f:  # type: ignore
+            self._write_zinc(f, chunksize)
+        return None
+
+    def iter_zinc(self, chunk_rows: int = 10_000) -> Iterator[bytes]:
+        """Yields the grid in Zinc format, as UTF-8 encoded chunks.
+
+        The first chunk holds the version line and the column definitions,
+        and each further one chunk_rows rows. Rows are only formatted as
+        their chunk is requested, so the chunks can be streamed (e.g. as
+        the body of an HTTP response) without holding the whole text.
+
+        Args:
+            chunk_rows: int, default 10000
+                Number of rows per chunk.
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be positive, not {chunk_rows}")
+        yield self._header_str().encode("utf-8")
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        for cols in self._format_chunks(chunk_rows):
+            writer.writerows(zip(*cols))
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+
+    def _write_zinc(self, f: IO[str], chunksize: Optional[int]):
+        f.write(self._header_str())
+        # Quotes cells holding commas, quotes or newlines, as to_csv did
+        writer = csv.writer(f, lineterminator="\n")
+        for cols in self._format_chunks(chunksize):
+            writer.writerows(zip(*cols))
+
+    def _header_str(self) -> str:
+        return self._grid_info_str() + "\n" + self._column_info_str() + "\n"
+
+    def _format_chunks(
+            self, chunksize: Optional[int]) -> Iterator[List[List[str]]]:
+        """Formats the rows chunksize at a time (or all at once, if None)."""
+        num_rows = len(self.data)
+        step = chunksize or max(num_rows, 1)
+        for start in range(0, num_rows, step):
+            yield self._zinc_format_columns(
+                self.data.iloc[start:start + step])
 
     def _grid_info_str(self) -> str:
-        return " ".join([
-            f'ver:"{self.version}.0"'] + _stringify_tags(self.grid_info))
+        return _grid_info_str(self.version, self.grid_info)
 
     def _column_info_str(self) -> str:
-        cols: List[str] = []
-        for colname, tags in self.column_info.items():
-            tagpairs = [colname] + _stringify_tags(tags)
-            cols.append(" ".join(tagpairs))
-        return ",".join(cols)
-
-    def _zinc_format_data(self) -> pd.DataFrame:
-        df: pd.DataFrame = self.data.copy()
-        for i, colinfo in enumerate(self.column_info.values()):
-            # Format datetime index as appropriate
-            if i == 0:
-                # TODO: Don't use a Python for loop! For the life of me, i
-                # cannot find a way to do this in Pandas/NumPy. There is no
-                # obvious builtin vectorized version.
-                df.index = [t.isoformat() for t in df.index.to_pydatetime()]
-                if 'tz' in colinfo:
-                    df.index += " " + str(colinfo['tz'])
-            # Append units to columns where relevant
-            elif i >= 1:
-                colname: str = df.columns[i-1]
-                if "unit" in colinfo:
-                    notna: pd.Series = df[colname].notna()
-                    unit: str = str(colinfo["unit"])
-                    df.loc[notna, colname] = (
-                        df.loc[notna, colname].astype(str) + unit)
-        return df
+        return _column_info_str(self.column_info)
+
+    def _zinc_format_columns(self, data: pd.DataFrame) -> List[List[str]]:
+        """Formats the index and each column of rows of data as Zinc cells.
+
+        Each column is formatted as a whole, and the data is not copied.
+        """
+        colinfos = list(self.column_info.values())
+        return _format_rows(
+            data.index, (series for _, series in data.items()),
+            colinfos[0].get(TZ_COLTAG) if colinfos else None,
+            [colinfo.get(UNIT_COLTAG) for colinfo in colinfos[1:]])
+
+
+def _grid_info_str(version: int, grid_info: Dict[str, Any]) -> str:
+    return " ".join([f'ver:"{version}.0"'] + _stringify_tags(grid_info))
+
+
+def _column_info_str(column_info: Dict[str, Dict[str, Any]]) -> str:
+    cols: List[str] = []
+    for colname, tags in column_info.items():
+        tagpairs = [colname] + _stringify_tags(tags)
+        cols.append(" ".join(tagpairs))
+    return ",".join(cols)
+
+
+def _format_rows(
+        idx: pd.DatetimeIndex,
+        columns: Iterable[pd.Series],
+        tz: Optional[Scalar],
+        units: List[Optional[Scalar]]) -> List[List[str]]:
+    """Formats the ts index and the other columns of rows as Zinc cells.
+
+    Returns the cells by column, starting with the index.
+    """
+    cols = [_format_datetimes(idx, tz)]
+    for series, unit in zip(columns, units):
+        cols.append(_format_values(series, unit))
+    return cols
+
+
+def _format_datetimes(
+        idx: pd.DatetimeIndex, tz: Optional[Scalar]) -> List[str]:
+    """Formats timestamps as datetime.isoformat() would, plus the tz name.
+
+    The wall-clock times are formatted by NumPy, and each distinct UTC
+    offset only once.
+    """
+    utc_ns = idx.asi8
+    wall_ns = utc_ns if idx.tz is None else idx.tz_localize(None).asi8
+    wall_s, frac_ns = np.divmod(wall_ns, 10**9)
+    cells = np.datetime_as_string(
+        wall_s.astype('M8[s]'), unit='s').astype(object)
+    micros = frac_ns // 1000
+    fractional = micros != 0
+    if fractional.any():
+        cells[fractional] += np.char.mod(
+            '.%06d', micros[fractional]).astype(object)
+    if idx.tz is not None:
+        offsets, inverse = np.unique(
+            (wall_ns - utc_ns) // 10**9, return_inverse=True)
+        cells += np.array(
+            [_format_utc_offset(o) for o in offsets], dtype=object)[inverse]
+    if tz is not None:
+        cells += " " + str(tz)
+    return cells.tolist()
+
+
+def _format_utc_offset(seconds: int) -> str:
+    sign = '-' if seconds < 0 else '+'
+    hours, rest = divmod(abs(int(seconds)), 3600)
+    minutes, seconds = divmod(rest, 60)
+    if seconds:
+        return f"{sign}{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+def _format_values(series: pd.Series, unit: Optional[Scalar]) -> List[str]:
+    """Formats a column of data as to_csv would, with the unit appended.
+
+    Missing values become empty cells.
+    """
+    notna = series.notna().to_numpy()
+    if series.dtype.kind in 'biuf':
+        # NumPy formats numbers as Python's str() does
+        cells = series.to_numpy().astype(str).astype(object)
+    else:
+        cells = np.array([str(v) for v in series.tolist()], dtype=object)
+    if unit is not None:
+        cells[notna] += str(unit)
+    cells[~notna] = ''
+    return cells.tolist()
+
+
+class GridHeader:
+    """The metadata of a Grid, without any of its tabular data.
+
+    Attributes:
+        version: The version of Zinc used.
+        grid_info: A Dict[str, Any] of grid-level metadata, as in Grid.
+        column_info: A Dict[str, Dict[str, Any]] of metadata about each
+            column, as in Grid.
+    """
+
+    def __init__(
+            self,
+            *,
+            version: int,
+            grid_info: Dict[str, Any],
+            column_info: Dict[str, Dict[str, Any]]):
+        self.version = version  # type: int
+        self.grid_info = grid_info  # type: Dict[str, Any]
+        self.column_info = column_info  # type: Dict[str, Dict[str, Any]]
+
+    def __repr__(self):
+        return ("GridHeader<\n"
+                + f"version: {self.version}\n"
+                + f"grid_info: {self.grid_info.__repr__()}\n"
+                + f"column_info: {self.column_info.__repr__()}"
+                + ">")
 
 
 class GridBuilder:
     """Builder for Grid.
 
     Collects all necessary information before constructing the Grid.
+
+    Rows are stored by column. The ts column and columns of kind Number are
+    appended into typed arrays rather than lists of Scalars, and accept
+    primitive ints and floats as well as Scalars; other columns are kept as
+    lists of Scalars.
     """
 
     def __init__(self, version: int):
         self.version = version
         self.grid_meta: Dict[str, Any] = {}
         self.col_meta: Dict[str, Dict[str, Scalar]] = {}
-        self.cols: Dict[str, List[Scalar]] = {}
+        self.cols: Dict[str, Any] = {}
+        # Kinds to use for columns without a kind tag, instead of inferring
+        # them from the rows at hand
+        self.inferred_kinds: Dict[str, Optional[String]] = {}
+        self._appends: List[Callable[[Any], None]] = []
 
     def add_meta(self, grid_meta: Dict[str, Any]):
         self.grid_meta = grid_meta
 
     def add_col(self, colname: str, col: Dict[str, Scalar]):
         self.col_meta[colname] = col
-        self.cols[colname] = []
+        self.cols[colname] = _new_column(colname, col)
+        self._appends = [c.append for c in self.cols.values()]
+
+    def add_row(self, row: List[Any]):
+        for append, v in zip(self._appends, row):
+            append(v)
+
+    def add_columns(self, cols: Dict[str, Any]):
+        """Appends the rows of another GridBuilder's columns.
+
+        The columns must come from a builder for the same columns, e.g. one
+        that parsed another range of the rows of the same grid.
+        """
+        for col, other in zip(self.cols.values(), cols.values()):
+            col.extend(other)
 
-    def add_row(self, row: List[Scalar]):
-        for k, v in zip(self.cols, row):
-            self.cols[k].append(v)
+    @property
+    def num_rows(self) -> int:
+        """The number of rows added since the last flush."""
+        for col in self.cols.values():
+            return len(col)
+        return 0
+
+    def flush(self) -> Grid:
+        """Constructs a Grid from the rows added so far, then clears them.
+
+        The metadata and columns are kept, so rows can keep being added and
+        flushed into further Grids sharing the same grid and column info.
+        """
+        cols = self.cols
+        self.cols = {k: _new_column(k, self.col_meta[k]) for k in cols}
+        self._appends = [c.append for c in self.cols.values()]
+        return self._build(cols)
 
     def build(self) -> Grid:
         """Constructs and returns a Grid.
 
         A GridBuilder instance cannot be safely reused!
         """
-        idx = [x.value for x in self.cols.pop('ts')]
-        df = pd.DataFrame(data=self.cols, index=idx)
+        return self._build(self.cols)
+
+    def _build(self, cols: Dict[str, Any]) -> Grid:
+        ts = cols.pop('ts')
+        if isinstance(ts, _DatetimeColumn):
+            idx = ts.to_index(self.col_meta['ts'])
+        else:
+            idx = _datetime_index(ts, self.col_meta['ts'])
+        # Convert the columns before building the DataFrame, so that none
+        # of them is first made an object array of Scalars
+        data: Dict[str, Any] = {}
+        for col, values in cols.items():
+            colinfo = self.col_meta[col]
+            if isinstance(values, _NumberColumn):
+                values = values.to_numpy()
+            if isinstance(values, list):
+                if (KIND_COLTAG not in colinfo
+                        and col in self.inferred_kinds):
+                    values = _apply_inferred_kind(
+                        values, self.inferred_kinds[col])
+                else:
+                    values = _sanitize_values(values, colinfo)
+            data[col] = values
+        df = pd.DataFrame(data=data, index=idx)
         df.index.name = 'ts'
         # Rename columns with ID tag, if available
         renaming = {}
@@ -190,12 +414,6 @@ class GridBuilder:
             if ID_COLTAG in v:
                 renaming[col] = str(v[ID_COLTAG])
         df.rename(columns=renaming, inplace=True)
-        for i, col in enumerate(self.col_meta):
-            # i == 0 corresponds to the index; skip
-            if i > 0:
-                colinfo = self.col_meta[col]
-                cname = df.columns[i-1]
-                df[cname] = _sanitize_series(df[cname], colinfo)
         return Grid(
             version=self.version,
             grid_info=self.grid_meta,
@@ -203,43 +421,350 @@ class GridBuilder:
             data=df)
 
 
+def _new_column(colname: str, colinfo: Dict[str, Any]) -> Any:
+    """Makes the storage for the values of a column."""
+    if colname == 'ts':
+        return _DatetimeColumn()
+    if colinfo.get(KIND_COLTAG) == NUMBER_KIND:
+        return _NumberColumn()
+    return []
+
+
+class _NumberColumn:
+    """The values of a Number column, as a typed array and validity mask.
+
+    Quantities are stored as int64 for as long as they are all integers, and
+    as float64 from the first that is not (or from the first null), which is
+    what pd.to_numeric makes of them. Units are dropped, as by _pandasify.
+    Should any other value turn up, or an integer too large for int64, the
+    column reverts to a list of Scalars.
+    """
+
+    def __init__(self):
+        self.values = array('q')
+        # 1 for each valid value, 0 for each null
+        self.mask = bytearray()
+        self.scalars: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        if self.scalars is not None:
+            return len(self.scalars)
+        return len(self.mask)
+
+    def append(self, v: Any):
+        if self.scalars is None:
+            qty = v.value if type(v) is Number else v
+            t = type(qty)
+            if t is int or t is float:
+                if t is float and self.values.typecode == 'q':
+                    self.values = array('d', self.values)
+                try:
+                    self.values.append(qty)
+                    self.mask.append(1)
+                    return
+                except OverflowError:
+                    # Too large for int64; left to pd.to_numeric, which
+                    # keeps it exact as uint64 if it can
+                    pass
+            elif v is NULL or v is NA or v is None:
+                if self.values.typecode == 'q':
+                    self.values = array('d', self.values)
+                self.values.append(0.0)
+                self.mask.append(0)
+                return
+            self.scalars = self._to_scalars()
+            self.values = array('q')
+            self.mask = bytearray()
+        if type(v) is int or type(v) is float:
+            v = Number(v)
+        self.scalars.append(v)
+
+    def extend(self, other: '_NumberColumn'):
+        """Appends the values of another column, as append would."""
+        if self.scalars is None and other.scalars is None:
+            values = other.values
+            if self.values.typecode != values.typecode:
+                self.values = array('d', self.values)
+                values = array('d', values)
+            self.values.extend(values)
+            self.mask.extend(other.mask)
+            return
+        if self.scalars is None:
+            self.scalars = self._to_scalars()
+            self.values = array('q')
+            self.mask = bytearray()
+        self.scalars.extend(
+            other.scalars if other.scalars is not None
+            else other._to_scalars())
+
+    def _to_scalars(self) -> List[Any]:
+        return [
+            Number(x) if valid else NULL
+            for x, valid in zip(self.values, self.mask)]
+
+    def to_numpy(self) -> Union[np.ndarray, List[Any]]:
+        """Returns the values as an int64 or float64 array, if they can be.
+
+        Otherwise, returns the Scalars to be sanitized as usual.
+        """
+        if self.scalars is not None or not self.mask:
+            return self.scalars or []
+        # Views on the arrays, rather than copies; the column is done with
+        if self.values.typecode == 'q':
+            return np.frombuffer(self.values, dtype=np.int64)
+        values = np.frombuffer(self.values, dtype=np.float64)
+        values[np.frombuffer(self.mask, dtype=np.uint8) == 0] = np.nan
+        return values
+
+
+class _DatetimeColumn:
+    """The values of the ts column, as nanoseconds since the epoch (UTC).
+
+    Datetimes are converted in batches, so that the ISO text of at most one
+    batch is held at a time, and each batch is parsed in one vectorized call.
+    """
+
+    BATCH_SIZE = 1 << 16
+
+    def __init__(self):
+        self.utc_ns = array('q')
+        self.pending: List[Any] = []
+        self.first: Any = None
+        # The UTC offset common to each batch, or None if they differ
+        self.offsets: Set[Optional[int]] = set()
+
+    def __len__(self) -> int:
+        return len(self.utc_ns) + len(self.pending)
+
+    def append(self, v: Any):
+        if self.first is None and not _is_null_ts(v):
+            self.first = v
+        self.pending.append(v)
+        if len(self.pending) >= self.BATCH_SIZE:
+            self._convert()
+
+    def extend(self, other: '_DatetimeColumn'):
+        """Appends the values of another column, as append would."""
+        self._convert()
+        other._convert()
+        self.utc_ns.extend(other.utc_ns)
+        self.offsets |= other.offsets
+        if self.first is None:
+            self.first = other.first
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickle the nanoseconds rather than the Datetimes, e.g. when sent
+        # back from a worker process
+        self._convert()
+        return self.__dict__
+
+    def _convert(self):
+        if self.pending:
+            utc_ns, offset = _utc_ns(self.pending)
+            self.utc_ns.frombytes(utc_ns.tobytes())
+            self.offsets.add(offset)
+            self.pending = []
+
+    def to_index(self, colinfo: Dict[str, Any]) -> pd.DatetimeIndex:
+        self._convert()
+        idx = pd.DatetimeIndex(
+            np.frombuffer(self.utc_ns, dtype=np.int64).copy(), tz='UTC')
+        offset = next(iter(self.offsets)) if len(self.offsets) == 1 else None
+        return _localize_index(idx, colinfo, self.first, offset)
+
+
+def _datetime_index(
+        values: List[Scalar], colinfo: Dict[str, Any]) -> pd.DatetimeIndex:
+    """Converts a column of Datetimes to a UTC-backed DatetimeIndex.
+
+    The index is localized to the column's Haystack tz (or else that of its
+    first Datetime), so that it keeps a single dtype across DST changes. If
+    that tz is unknown, the index keeps the UTC offset of the Datetimes, if
+    they all have the same one.
+    """
+    utc_ns, offset = _utc_ns(values)
+    idx = pd.DatetimeIndex(utc_ns, tz='UTC')
+    first = next((v for v in values if not _is_null_ts(v)), None)
+    return _localize_index(idx, colinfo, first, offset)
+
+
+def _utc_ns(values: List[Scalar]) -> Tuple[np.ndarray, Optional[int]]:
+    """Converts Datetimes to int64 nanoseconds since the epoch (UTC).
+
+    Datetimes whose ISO text has not been parsed yet are parsed together,
+    with a fixed format. Nulls become NaT. Also returns the UTC offset of
+    the other Datetimes, in nanoseconds, if they all have the same one, or
+    else None.
+    """
+    isos = [getattr(x, 'iso', None) for x in values]
+    if None in isos:
+        nulls = np.fromiter(
+            map(_is_null_ts, values), dtype=np.bool_, count=len(values))
+        if nulls.any():
+            utc_ns = np.full(len(values), _NAT_NS, dtype=np.int64)
+            present = [v for v, null in zip(values, nulls) if not null]
+            if not present:
+                return utc_ns, None
+            utc_ns[~nulls], common = _utc_ns(present)
+            return utc_ns, common
+    if isos and None not in isos:
+        local, offsets = zip(*map(_split_utc_offset, cast(List[str], isos)))
+        try:
+            naive = pd.to_datetime(local, format='%Y-%m-%dT%H:%M:%S')
+        except ValueError:
+            # e.g. fractional seconds, or no seconds at all
+            naive = pd.to_datetime(local)
+        offset_ns = np.fromiter(
+            map(_offset_ns, offsets), dtype=np.int64, count=len(offsets))
+        common = (int(offset_ns[0])
+                  if offset_ns.min() == offset_ns.max() else None)
+        return naive.asi8 - offset_ns, common
+    timestamps = [x.value for x in values]
+    # Timezone-naive Timestamps are taken to be UTC, as by pd.to_datetime
+    deltas = {ts.utcoffset() or datetime.timedelta(0) for ts in timestamps}
+    common = None
+    if len(deltas) == 1:
+        common = deltas.pop() // datetime.timedelta(microseconds=1) * 1000
+    return pd.DatetimeIndex(
+        pd.to_datetime(timestamps, utc=True)).asi8, common
+
+
+def _is_null_ts(v: Any) -> bool:
+    return v is NULL or v is None
+
+
+def _localize_index(
+        idx: pd.DatetimeIndex, colinfo: Dict[str, Any],
+        first: Any, offset_ns: Optional[int]) -> pd.DatetimeIndex:
+    tz = colinfo.get(TZ_COLTAG)
+    if tz is None and isinstance(first, Datetime):
+        tz = first.tz
+    iana = _iana_tz(str(tz)) if tz else None
+    if iana is not None:
+        return idx.tz_convert(iana)
+    if offset_ns:
+        # An unknown tz; keep the UTC offset the Datetimes were written in
+        return idx.tz_convert(datetime.timezone(
+            datetime.timedelta(microseconds=offset_ns // 1000)))
+    return idx
+
+
+def _split_utc_offset(iso: str) -> Tuple[str, str]:
+    if iso.endswith('Z'):
+        return iso[:-1], 'Z'
+    if len(iso) > 6 and iso[-6] in '+-' and iso[-3] == ':':
+        return iso[:-6], iso[-6:]
+    return iso, ''
+
+
+@functools.lru_cache(maxsize=None)
+def _offset_ns(offset: str) -> int:
+    """Nanoseconds east of UTC for a UTC offset such as '-07:00' or 'Z'."""
+    if offset in ('', 'Z'):
+        return 0
+    sign = -1 if offset[0] == '-' else 1
+    return sign * (int(offset[1:3]) * 3600 + int(offset[4:6]) * 60) * 10**9
+
+
+@functools.lru_cache(maxsize=None)
+def _iana_tz(haystack_tz: str) -> Optional[str]:
+    """Maps a Haystack tz name (e.g. 'Los_Angeles') to its IANA name."""
+    return _haystack_tz_names().get(haystack_tz)
+
+
+@functools.lru_cache(maxsize=None)
+def _haystack_tz_names() -> Dict[str, str]:
+    # Haystack names a tz by the city part of its IANA name, within these
+    # regions
+    regions = ('Africa', 'America', 'Antarctica', 'Asia', 'Atlantic',
+               'Australia', 'Etc', 'Europe', 'Indian', 'Pacific')
+    names: Iterable[str] = ()
+    try:
+        import zoneinfo
+        names = zoneinfo.available_timezones()
+    except ImportError:
+        pass
+    if not names:
+        import pytz  # type: ignore
+        names = pytz.all_timezones
+    by_city: Dict[str, str] = {'UTC': 'UTC'}
+    for name in sorted(names):
+        if name.split('/')[0] in regions:
+            by_city.setdefault(name.rpartition('/')[2], name)
+    return by_city
+
+
 def _pandasify(val: Scalar) -> Any:
-    if val is None or val in (NULL, NA):
+    if val is None or val is NULL or val is NA:
         return np.nan
     if isinstance(val, Number) or isinstance(val, String):
         return val.value
     return str(val)
 
 
-def _pandasify_bool(val: Scalar) -> Any:
-    if isinstance(val, Boolean):
-        return val.value
-    if val is NULL:
-        return None
-    return val
+def _to_numeric(values: List[Scalar]) -> np.ndarray:
+    """Converts a column of Numbers to an int64 or float64 array.
+
+    Quantities are taken straight from the Numbers in one pass; only other
+    values, such as nulls, go through _pandasify.
+    """
+    return pd.to_numeric(
+        [v.value if type(v) is Number else _pandasify(v) for v in values])
 
 
-def _sanitize_series(series: pd.Series, colinfo: Dict[str, Any]) -> pd.Series:
-    # 1. Ascertain dtype of Series
-    # 2. Apply pandasify to series
-    # 3. Reinterpret as dtype
+def _to_bool(values: List[Scalar]) -> Any:
+    """Converts a column of Booleans to a bool array.
+
+    The array has the nullable boolean dtype instead if there are nulls, or
+    is an object array of the values as given if they are not all Booleans.
+    """
+    bools = [
+        v.value if type(v) is Boolean
+        else None if v is NULL or v is NA or v is None
+        else v
+        for v in values]
+    try:
+        array = pd.array(bools, dtype='boolean')
+    except TypeError:
+        return pd.array(bools, dtype=object)
+    if not array.isna().any():
+        return array.to_numpy(dtype=bool)
+    return array
+
+
+def _sanitize_values(values: List[Scalar], colinfo: Dict[str, Any]) -> Any:
+    """Converts a column of Scalars to the array for its DataFrame column."""
     kind = colinfo.get(KIND_COLTAG, None)
     if kind is not None:
         if kind == NUMBER_KIND:
-            return pd.to_numeric(series.apply(_pandasify))
+            return _to_numeric(values)
+        elif kind == BOOL_KIND:
+            return _to_bool(values)
         elif ENUM_COLTAG in colinfo:
             cat_type = CategoricalDtype(
                 categories=str(colinfo[ENUM_COLTAG]).split(","))
-            return series.apply(_pandasify).astype(cat_type)
+            return pd.Categorical(
+                [_pandasify(v) for v in values], dtype=cat_type)
     else:
-        logging.debug("No column headers, heuristically inferring type")
-        sample = series[:1000].dropna()
-        if not len(sample):
-            logging.debug("No non-NA values from which to infer type")
-            return series
-        for v in sample:
-            if isinstance(v, Number):
-                return pd.to_numeric(series.apply(_pandasify))
-            if isinstance(v, Boolean):
-                return series.apply(_pandasify_bool)
-    return series
+        return _apply_inferred_kind(values, _infer_kind(values))
+    return values
+
+
+def _infer_kind(values: Iterable[Scalar]) -> Optional[String]:
+    """Heuristically infers the kind of a column from its first values."""
+    logging.debug("No column headers, heuristically inferring type")
+    for v in itertools.islice(values, 1000):
+        if isinstance(v, Number):
+            return NUMBER_KIND
+        if isinstance(v, Boolean):
+            return BOOL_KIND
+    logging.debug("No Number or Boolean values from which to infer type")
+    return None
+
+
+def _apply_inferred_kind(values: List[Scalar], kind: Optional[String]) -> Any:
+    if kind == NUMBER_KIND:
+        return _to_numeric(values)
+    if kind == BOOL_KIND:
+        return _to_bool(values)
+    return values
@@ -43,6 +43,8 @@ class TokenType(Enum):
 
 
 class Token:
+    __slots__ = ('ttype', 'val')
+
     def __init__(self, ttype: TokenType, val: str):
         self.ttype = ttype
         self.val = val
@@ -54,14 +56,16 @@ class Token:
         return f"Token({self.ttype}, {self.val})"
 
     def __eq__(self, other):
-        if not isinstance(other, type(self)):
-            return False
         if other is self:
             return True
-        return self.ttype == other.ttype and self.val == other.val
+        if not isinstance(other, type(self)):
+            return False
+        return self.ttype is other.ttype and self.val == other.val
 
 
 class NumberToken(Token):
+    __slots__ = ('unit_index',)
+
     def __init__(self, val: str, unit_index: int):
         self.ttype = TokenType.NUMBER
         self.val = val
@@ -72,11 +76,11 @@ class NumberToken(Token):
                 f"{self.val.__repr__()}, unit_index={self.unit_index}")
 
     def __eq__(self, other):
-        if not isinstance(other, type(self)):
-            return False
         if other is self:
             return True
-        return (self.ttype == other.ttype and
+        if not isinstance(other, type(self)):
+            return False
+        return (self.ttype is other.ttype and
                 self.val == other.val and
                 self.unit_index == other.unit_index)
 
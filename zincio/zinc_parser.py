@@ -1,7 +1,16 @@
 import io
+import itertools
+import mmap as mmap_module
+import os
+import re
+import asyncio
+import concurrent.futures
+from concurrent.futures import ProcessPoolExecutor
 from os import PathLike
 import pandas as pd  # type: ignore
-from typing import Dict, IO, List, Optional, Union
+from typing import (
+    Any, Callable, Dict, IO, Iterable, Iterator, List, Optional,
+    overload, Sequence, Tuple, Union)
 
 from .dtypes import (
     NULL,
@@ -21,13 +30,249 @@ from .dtypes import (
     Uri,
     XStr,
 )
-from .grid import Grid, GridBuilder
+from .compression import _infer_compression, _open_compressed
+from .grid import (
+    BOOL_KIND,
+    ID_COLTAG,
+    KIND_COLTAG,
+    NUMBER_KIND,
+    UNIT_COLTAG,
+    Grid,
+    GridBuilder,
+    GridHeader,
+    _infer_kind,
+)
 from . import tokens
 from .tokens import NumberToken, Token, TokenType
-from .zinc_tokenizer import ZincTokenizer
+from .zinc_tokenizer import (
+    CHUNK_SIZE, make_tokenizer, ZincTokenizer, ZincTokenizerException)
+
+# Type aliases
+FilePath = Union[str, PathLike]
+FilePathOrBuffer = Union[str, bytes, int, PathLike, IO]
+
+
+# Rows containing any of these may hold commas or newlines inside a value, so
+# they cannot be split naively
+_COMPLEX_ROW = re.compile(r'["`@\[{<(\r]')
+_SIMPLE_NUMBER = re.compile(
+    r'(-?[0-9]+(?:\.[0-9]+)?)'
+    r'((?![eE][-+0-9]|_[0-9]|(?<=^0)x)[a-zA-Z%$/_\x81-\U0010ffff]'
+    r'[a-zA-Z0-9%$/_\x81-\U0010ffff]*)?')
+_SIMPLE_DATETIME = re.compile(
+    r'([0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}'
+    r'(?::[0-9]{2}(?:\.[0-9]+)?)?(?:Z|[+-][0-9]{2}:[0-9]{2})?)'
+    r'(?: ([A-Z][a-zA-Z0-9_]*(?:(?<=GMT)[+-][0-9]+)?))?')
+_SIMPLE_RESERVED: Dict[str, Scalar] = {
+    'N': NULL,
+    'M': MARKER,
+    'R': REMOVE,
+    'NA': NA,
+    'NaN': NAN,
+    'INF': POS_INF,
+    'T': BOOL_TRUE,
+    'F': BOOL_FALSE,
+}
+
+
+def _decode_simple_cell(cell: str) -> Optional[Scalar]:
+    """Decodes a cell of a simple row, or returns None if it is not simple.
+
+    Produces the same Scalar that ZincParser._parse_val would.
+    """
+    if not cell:
+        return NULL
+    m = _SIMPLE_NUMBER.fullmatch(cell)
+    if m is not None:
+        raw = m.group(1)
+        qty = float(raw) if '.' in raw else int(raw)
+        return Number(qty, m.group(2))
+    v = _SIMPLE_RESERVED.get(cell)
+    if v is not None:
+        return v
+    m = _SIMPLE_DATETIME.fullmatch(cell)
+    if m is not None:
+        return Datetime.from_iso(m.group(1), m.group(2) or '')
+    return None
+
+
+# Decodes the text of a cell, or returns None if it can't
+CellDecoder = Callable[[str], Any]
+
+
+def _decode_datetime_cell(cell: str) -> Optional[Scalar]:
+    m = _SIMPLE_DATETIME.fullmatch(cell)
+    if m is not None:
+        return Datetime.from_iso(m.group(1), m.group(2) or '')
+    return None
+
+
+def _number_decoder(
+        unit: Optional[str], primitive: bool = False) -> CellDecoder:
+    """Makes a decoder for the numbers of a column with a known unit.
+
+    If primitive, the decoder returns the bare int or float quantity.
+    """
+    n = len(unit) if unit else 0
+
+    def decode_qty(cell: str) -> Optional[Union[int, float]]:
+        if n:
+            if not cell.endswith(unit):  # type: ignore
+                return None
+            raw = cell[:-n]
+        else:
+            raw = cell
+        try:
+            return float(raw) if '.' in raw else int(raw)
+        except ValueError:
+            return None
+
+    if primitive:
+        return decode_qty
+
+    def decode(cell: str) -> Optional[Scalar]:
+        qty = decode_qty(cell)
+        return Number(qty, unit) if qty is not None else None
+    return decode
+
+
+_BOOL_CELLS: Dict[str, Scalar] = {'T': BOOL_TRUE, 'F': BOOL_FALSE}
+
+
+def _column_decoder(
+        colname: str,
+        col_meta: Dict[str, Scalar],
+        primitive: bool = False) -> CellDecoder:
+    """Compiles a decoder for the cells of a column from its metadata.
+
+    The decoder only handles the values the column is declared to hold;
+    other cells are left to _decode_simple_cell. If primitive, numbers are
+    decoded to ints and floats, for a GridBuilder to store in typed arrays.
+    """
+    if colname == 'ts':
+        return _decode_datetime_cell
+    kind = col_meta.get(KIND_COLTAG)
+    if kind == NUMBER_KIND:
+        unit = col_meta.get(UNIT_COLTAG)
+        return _number_decoder(
+            str(unit) if unit is not None else None, primitive)
+    if kind == BOOL_KIND:
+        return _BOOL_CELLS.get
+    return _decode_simple_cell
+
+
+def _decode_simple_row(
+        line: str,
+        num_cols: int,
+        decoders: List[CellDecoder],
+        usecols: Optional[List[int]] = None) -> Optional[List[Any]]:
+    """Decodes a row without strings, URIs, refs or nested values.
+
+    Each cell is decoded by the decoder of its column. Only the cells at the
+    usecols positions are decoded, if given. Returns None if the row needs
+    the general tokenizer.
+    """
+    if _COMPLEX_ROW.search(line) is not None:
+        return None
+    parts = line.split(',')
+    if len(parts) != num_cols:
+        return None
+    if usecols is not None:
+        parts = [parts[i] for i in usecols]
+    cells: List[Any] = []
+    for part, decode in zip(parts, decoders):
+        v = decode(part) if part else NULL
+        if v is None:
+            v = _decode_simple_cell(part)
+            if v is None:
+                return None
+        cells.append(v)
+    return cells
+
+
+# The wall-clock time and UTC offset of a raw Zinc DateTime
+_RAW_DATETIME = re.compile(
+    r'([0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}'
+    r'(?::[0-9]{2}(?:\.[0-9]+)?)?)(Z|[+-][0-9]{2}:[0-9]{2})')
+
+
+def _wall_clock_key(local: str) -> str:
+    """Normalizes a wall-clock time so that strings compare like times."""
+    if len(local) == 16:
+        # No seconds
+        return local + ':00'
+    if '.' in local:
+        return local.rstrip('0').rstrip('.')
+    return local
+
+
+class _TimeRange:
+    """Locates raw Zinc DateTimes relative to an inclusive [start, end].
+
+    Instead of building a Timestamp per row, each bound is rendered once per
+    UTC offset as wall-clock text in that offset, so that a row can be
+    placed by comparing strings.
+    """
+
+    def __init__(self, start: Any, end: Any):
+        self.start = self._to_timestamp(start)
+        self.end = self._to_timestamp(end)
+        self._bounds: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    @staticmethod
+    def _to_timestamp(t: Any) -> Optional[pd.Timestamp]:
+        if t is None:
+            return None
+        ts = pd.Timestamp(t)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize('UTC')
+        return ts
+
+    def _wall_clock(self, ts: Optional[pd.Timestamp], offset: str):
+        if ts is None:
+            return None
+        utc = ts.tz_convert('UTC').tz_localize(None)
+        if offset != 'Z':
+            sign = -1 if offset[0] == '-' else 1
+            utc += sign * pd.Timedelta(
+                hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        return _wall_clock_key(utc.isoformat())
+
+    def locate(self, raw: str) -> Optional[int]:
+        """Returns -1, 0 or 1 if raw is before, within or after the range.
+
+        Returns None if raw does not start with a DateTime.
+        """
+        m = _RAW_DATETIME.match(raw)
+        if m is None:
+            return None
+        offset = m.group(2)
+        bounds = self._bounds.get(offset)
+        if bounds is None:
+            bounds = (self._wall_clock(self.start, offset),
+                      self._wall_clock(self.end, offset))
+            self._bounds[offset] = bounds
+        key = _wall_clock_key(m.group(1))
+        if bounds[0] is not None and key < bounds[0]:
+            return -1
+        if bounds[1] is not None and key > bounds[1]:
+            return 1
+        return 0
+
 
-# Type alias
-FilePathOrBuffer = Union[str, bytes, int, PathLike, io.StringIO]
+# Strings and URIs, which may hold newlines that do not end a row
+_QUOTED_BYTES = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|`(?:[^`\\]|\\.)*`', re.DOTALL)
+
+
+# Bytes that end a row or start a string or URI, and those that end or escape
+# within a string or URI
+_ROW_SPECIALS = re.compile(rb'[\n"`]')
+_QUOTE_ENDS = {
+    ord('"'): re.compile(rb'["\\]'),
+    ord('`'): re.compile(rb'[`\\]'),
+}
+_NEWLINE_BYTE = ord('\n')
 
 
 class ZincParseException(Exception):
@@ -38,57 +283,767 @@ class ZincErrorGridException(Exception):
     pass
 
 
-def parse(s: Union[bytes, str]) -> Grid:
+# Tokens opening and closing nested values, for skipping over them
+_OPENERS = (tokens.LBRACKET, tokens.LBRACE, tokens.LPAREN, tokens.DOUBLELT)
+_CLOSERS = (tokens.RBRACKET, tokens.RBRACE, tokens.RPAREN, tokens.DOUBLEGT)
+
+
+def parse(
+        s: Union[bytes, memoryview, str],
+        tokenizer: Optional[str] = None,
+        usecols: Optional[Sequence[Union[str, Ref]]] = None,
+        start: Any = None,
+        end: Any = None) -> Grid:
     """Parses utf-8 encoded string to a Grid.
 
     Arguments:
-        s: bytes or utf-8 encoded string to be parsed.
+        s: bytes or utf-8 encoded string to be parsed. Bytes are tokenized
+            in place, without first being decoded to a str.
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        usecols: list of str or Ref, optional
+            Columns to read; see `read`.
+        start, end: datetime-like, optional
+            Time range of rows to read; see `read`.
     """
-    if isinstance(s, bytes):
-        return read(io.StringIO(s.decode()))
-    return read(io.StringIO(s))
+    source = io.StringIO(s) if isinstance(s, str) else s
+    return ZincParser(
+        make_tokenizer(source, tokenizer), usecols, start, end).parse()
+
+
+@overload
+def read(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str] = ...,
+        mmap: bool = ...,
+        chunksize: None = ...,
+        usecols: Optional[Sequence[Union[str, Ref]]] = ...,
+        start: Any = ...,
+        end: Any = ...,
+        workers: Optional[int] = ...,
+        compression: Optional[str] = ...,
+) -> Grid: ...
 
 
-def read(filepath_or_buffer: FilePathOrBuffer) -> Grid:
+@overload
+def read(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str],
+        mmap: bool,
+        chunksize: int,
+        usecols: Optional[Sequence[Union[str, Ref]]] = ...,
+        start: Any = ...,
+        end: Any = ...,
+        workers: Optional[int] = ...,
+        compression: Optional[str] = ...,
+) -> Iterator[Grid]: ...
+
+
+@overload
+def read(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str] = ...,
+        mmap: bool = ...,
+        *,
+        chunksize: int,
+        usecols: Optional[Sequence[Union[str, Ref]]] = ...,
+        start: Any = ...,
+        end: Any = ...,
+        workers: Optional[int] = ...,
+        compression: Optional[str] = ...,
+) -> Iterator[Grid]: ...
+
+
+def read(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str] = None,
+        mmap: bool = False,
+        chunksize: Optional[int] = None,
+        usecols: Optional[Sequence[Union[str, Ref]]] = None,
+        start: Any = None,
+        end: Any = None,
+        workers: Optional[int] = None,
+        compression: Optional[str] = 'infer',
+) -> Union[Grid, Iterator[Grid]]:
     """Reads utf-8 encoded Zinc file or buffer to a Grid.
 
     Arguments:
         filepath_or_buffer: str, path object, or file-like object
             Accepts any path-like object that can be opened or a file-like
             object that has a read() method.
+        tokenizer: str, optional
+            Tokenizer engine to use. 'char' scans the input one character at
+            a time in Python; 'regex' hands the scanning to a single compiled
+            regular expression, and reads files and binary buffers as bytes
+            without decoding them up front. Defaults to 'char' for paths and
+            text buffers, and 'regex' for binary buffers.
+        mmap: bool, default False
+            Map the file into memory and tokenize the mapped bytes in place,
+            rather than reading it in blocks. Implies tokenizer='regex'
+            unless another engine is given. Buffers that cannot be mapped,
+            such as in-memory or non-seekable streams, are read as usual.
+        chunksize: int, optional
+            Return an iterator of Grids of at most this many rows each,
+            rather than a single Grid. Every chunk shares the same grid_info
+            and column_info, and only one chunk is held in memory at a time.
+        usecols: list of str or Ref, optional
+            Columns to read, each given by column name or by the column's
+            `id` Ref (as a Ref, or a str such as "@p:q01b001:r:0197767d").
+            Cells of other columns are skipped without being decoded, and
+            their column_info is dropped. The 'ts' column is always read,
+            since it becomes the index.
+        start, end: datetime-like, optional
+            Only read rows whose 'ts' lies between start and end, inclusive.
+            Timezone-naive values are taken to be UTC. Rows are expected to
+            be sorted by 'ts', as in his grids: rows before start are skipped
+            without being decoded, and reading stops at the first row after
+            end, leaving the rest of the buffer unread.
+        workers: int, optional
+            Parse the rows in this many processes. The rows are split into
+            byte ranges of about equal size, each parsed in its own process,
+            and the results joined in order; the Grid is the same as when
+            parsed serially. Cannot be combined with chunksize.
+        compression: str, default 'infer'
+            'gzip', 'bz2' or 'xz' to decompress the file or binary buffer in
+            blocks as it is tokenized, or None. 'infer' picks one from the
+            suffix of a path ('.gz', '.bz2' or '.xz'). Compressed files are
+            read in blocks even if mmap is given; with workers, they are
+            decompressed up front.
+    """
+    if workers is not None:
+        if workers < 1:
+            raise ValueError(f"workers must be positive, not {workers}")
+        if workers > 1:
+            if chunksize is not None:
+                raise ValueError("workers cannot be combined with chunksize")
+            return _read_parallel(
+                filepath_or_buffer, tokenizer, workers, usecols, start, end,
+                compression)
+    if chunksize is not None:
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be positive, not {chunksize}")
+        return _read_chunks(
+            filepath_or_buffer, tokenizer, mmap, chunksize, usecols,
+            start, end, compression)
+    binary = mmap or tokenizer == 'regex'
+    with _handle_buf(filepath_or_buffer, binary, compression) as buf:
+        mapped = _map_buf(buf) if mmap else None
+        if mapped is None:
+            return ZincParser(
+                make_tokenizer(buf, tokenizer), usecols, start, end).parse()
+        with mapped:
+            return ZincParser(
+                make_tokenizer(mapped, tokenizer), usecols, start,
+                end).parse()
+
+
+def _read_parallel(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str],
+        workers: int,
+        usecols: Optional[Sequence[Union[str, Ref]]],
+        start: Any,
+        end: Any,
+        compression: Optional[str]) -> Grid:
+    # Workers reopen files by path, rather than being sent their rows; file
+    # descriptors and buffers are sent their rows
+    path: Optional[Union[str, bytes]] = None
+    if isinstance(filepath_or_buffer, (str, bytes, PathLike)):
+        path = os.fspath(filepath_or_buffer)
+    with _handle_buf(filepath_or_buffer, True, compression) as buf:
+        mapped = _map_buf(buf)
+        if mapped is None:
+            path = None
+            raw = buf.read()
+            data = raw.encode('utf-8') if isinstance(raw, str) else raw
+        else:
+            data = mapped
+        try:
+            # Parse the header once, and infer the kinds of untyped columns
+            # from the leading rows, as a serial parse would
+            parser = ZincParser(
+                make_tokenizer(data, tokenizer), usecols, start, end)
+            header = parser.parse_header()
+            sample = list(itertools.islice(parser.iter_rows(), 1000))
+            kinds = {
+                colname: _infer_kind(row[i] for row in sample)
+                for i, (colname, col_meta)
+                in enumerate(header.column_info.items())
+                if i > 0 and KIND_COLTAG not in col_meta}
+
+            bounds = _split_rows(data, workers)
+            header_bytes = bytes(data[:bounds[0]])
+            with ProcessPoolExecutor(workers) as pool:
+                futures = [
+                    pool.submit(
+                        _parse_rows, header_bytes, path,
+                        bytes(data[a:b]) if path is None else None,
+                        a, b, tokenizer, kinds, usecols, start, end)
+                    for a, b in zip(bounds, bounds[1:])]
+                # The columns of each range are joined before being
+                # converted, so that the index is localized, and the dtype
+                # of each column picked, once for all the rows
+                gb = ZincParser._grid_builder(header)
+                gb.inferred_kinds = kinds
+                for future in futures:
+                    gb.add_columns(future.result())
+        finally:
+            if mapped is not None:
+                mapped.close()
+    return gb.build()
+
+
+def _parse_rows(
+        header: bytes,
+        path: Optional[Union[str, bytes]],
+        rows: Optional[bytes],
+        begin: int,
+        stop: int,
+        tokenizer: Optional[str],
+        kinds: Dict[str, Optional[String]],
+        usecols: Optional[Sequence[Union[str, Ref]]],
+        start: Any,
+        end: Any) -> Dict[str, Any]:
+    """Parses the rows in bytes [begin, stop) of a file, in a worker.
+
+    The rows are read from the file at path, unless given as rows. Returns
+    the columns of the GridBuilder the rows were added to, unconverted, to
+    be joined with those of the other ranges.
     """
-    with _handle_buf(filepath_or_buffer) as buf:
-        return ZincParser(ZincTokenizer(buf)).parse()
+    if rows is not None:
+        data = header + rows
+    else:
+        assert path is not None
+        with open(path, 'rb') as f:
+            f.seek(begin)
+            data = header + f.read(stop - begin)
+    parser = ZincParser(make_tokenizer(data, tokenizer), usecols, start, end)
+    gb = parser._start_grid()
+    gb.inferred_kinds = kinds
+    for cells in parser.iter_rows():
+        gb.add_row(cells)
+    parser._verify_end()
+    return gb.cols
+
+
+def _split_rows(data: Any, n: int) -> List[int]:
+    """Splits the rows of raw Zinc bytes into about n equal byte ranges.
+
+    Returns the offsets bounding the ranges, starting with the end of the
+    header and ending with the end of data. Every offset starts a row.
+    """
+    splitter = _RowSplitter(data)
+    rows_start = splitter.next_row(splitter.next_row(0))
+    size = len(data) - rows_start
+    bounds = [rows_start]
+    for k in range(1, n):
+        target = max(rows_start + size * k // n, bounds[-1])
+        bound = splitter.next_row(target)
+        if bound > bounds[-1] and bound < len(data):
+            bounds.append(bound)
+    bounds.append(len(data))
+    return bounds
+
+
+class _RowSplitter:
+    """Finds the starts of rows in raw Zinc bytes.
+
+    Newlines inside strings and URIs do not end a row. Positions must be
+    queried in increasing order.
+    """
+
+    def __init__(self, data: Any):
+        self._data = data
+        self._quoted = _QUOTED_BYTES.finditer(data)
+        self._cur = next(self._quoted, None)
+
+    def next_row(self, pos: int) -> int:
+        """Returns the start of the first row beginning after pos."""
+        while True:
+            nl = self._data.find(b'\n', pos)
+            if nl < 0:
+                return len(self._data)
+            while self._cur is not None and self._cur.end() <= nl:
+                self._cur = next(self._quoted, None)
+            if self._cur is not None and self._cur.start() < nl:
+                # The newline is quoted; look past the end of the quote
+                pos = self._cur.end()
+                continue
+            return nl + 1
+
+
+def read_many(
+        paths: Iterable[FilePath],
+        workers: Optional[int] = None,
+        tokenizer: Optional[str] = None,
+        as_completed: bool = False,
+) -> Union[Dict[FilePath, Union[Grid, Exception]],
+           Iterator[Tuple[FilePath, Union[Grid, Exception]]]]:
+    """Reads many Zinc files concurrently, in a pool of processes.
+
+    A file that cannot be parsed does not abort the batch: its
+    ZincParseException, ZincTokenizerException or ZincErrorGridException is
+    returned in place of its Grid. Other exceptions are raised.
+
+    Arguments:
+        paths: iterable of str or path objects
+            Files to read.
+        workers: int, optional
+            Number of processes to use. Defaults to the number of CPUs.
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        as_completed: bool, default False
+            Return an iterator of (path, Grid or exception) pairs in the order
+            in which the files finish parsing, rather than a dict keyed by
+            path in the order given.
+    """
+    paths = list(paths)
+    for path in paths:
+        # Buffers cannot be sent to the worker processes
+        if not isinstance(path, (str, PathLike)):
+            raise TypeError(
+                f"read_many reads files by path, not {type(path).__name__}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers must be positive, not {workers}")
+    results = _read_many(paths, workers, tokenizer)
+    if as_completed:
+        return results
+    by_path = dict(results)
+    return {path: by_path[path] for path in paths}
+
+
+def _read_many(
+        paths: List[FilePath],
+        workers: int,
+        tokenizer: Optional[str],
+) -> Iterator[Tuple[FilePath, Union[Grid, Exception]]]:
+    # Send several files per task, to amortize the round trip to a worker
+    batch = max(1, min(64, len(paths) // (workers * 4)))
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(_read_batch, paths[i:i + batch], tokenizer)
+            for i in range(0, len(paths), batch)]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+
+def _read_batch(
+        paths: List[FilePath],
+        tokenizer: Optional[str],
+) -> List[Tuple[FilePath, Union[Grid, Exception]]]:
+    """Reads files in a worker, capturing parse errors per file.
+
+    Grids are sent back with their data already typed, so mostly as numpy
+    arrays rather than as pickled Scalars.
+    """
+    results: List[Tuple[FilePath, Union[Grid, Exception]]] = []
+    for path in paths:
+        try:
+            results.append((path, read(path, tokenizer)))
+        except (ZincParseException, ZincErrorGridException,
+                ZincTokenizerException) as e:
+            results.append((path, e))
+    return results
 
 
-def _handle_buf(filepath_or_buffer: FilePathOrBuffer) -> IO:
-    if isinstance(filepath_or_buffer, io.StringIO):
-        return filepath_or_buffer
+async def read_async(
+        reader: Any,
+        tokenizer: Optional[str] = None,
+        usecols: Optional[Sequence[Union[str, Ref]]] = None,
+        start: Any = None,
+        end: Any = None) -> Grid:
+    """Reads a Zinc grid from an asyncio.StreamReader as it arrives.
+
+    Rows are parsed as each chunk arrives, and control returns to the event
+    loop between chunks, so the parse overlaps with the download rather than
+    blocking the loop once it completes.
+
+    Arguments:
+        reader: asyncio.StreamReader, or any object with an awaitable
+            read(n) returning bytes, and b'' at EOF.
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        usecols: list of str or Ref, optional
+            Columns to read; see `read`.
+        start, end: datetime-like, optional
+            Time range of rows to read; see `read`.
+    """
+    parser = ZincFeedParser(tokenizer, usecols, start, end)
+    while True:
+        data = await reader.read(CHUNK_SIZE)
+        if not data:
+            break
+        parser.feed(data)
+        # Let other tasks run even if the reader had data buffered already
+        await asyncio.sleep(0)
+    return parser.close()
+
+
+class _RowScanner:
+    """Finds the ends of rows in Zinc bytes that arrive in fragments.
+
+    Newlines inside strings and URIs do not end a row. The scan state is
+    kept between calls, so every byte is only scanned once.
+    """
+
+    def __init__(self) -> None:
+        self.pos: int = 0
+        # The quote character of the string or URI being scanned, if any
+        self._quote: Optional[int] = None
+        self._escaped: bool = False
+
+    def scan(self, buf: bytearray) -> List[int]:
+        """Returns the offsets just past each row end found since last scan."""
+        found: List[int] = []
+        pos = self.pos
+        n = len(buf)
+        if self._escaped and pos < n:
+            pos += 1
+            self._escaped = False
+        while pos < n:
+            if self._quote is None:
+                m = _ROW_SPECIALS.search(buf, pos)
+                if m is None:
+                    pos = n
+                    break
+                pos = m.end()
+                c = buf[m.start()]
+                if c == _NEWLINE_BYTE:
+                    found.append(pos)
+                else:
+                    self._quote = c
+                continue
+            m = _QUOTE_ENDS[self._quote].search(buf, pos)
+            if m is None:
+                pos = n
+                break
+            pos = m.end()
+            if buf[m.start()] == self._quote:
+                self._quote = None
+            elif pos < n:
+                # Skip the escaped character
+                pos += 1
+            else:
+                self._escaped = True
+        self.pos = pos
+        return found
+
+
+class ZincFeedParser:
+    """Parses a Zinc grid from bytes pushed to it in fragments.
+
+    Like xml.etree.XMLPullParser, data is fed as it becomes available, in
+    fragments of any size, which may split a row anywhere (e.g. within a
+    string, a number or a multi-byte character):
+
+        parser = ZincFeedParser()
+        for fragment in fragments:
+            parser.feed(fragment)
+        grid = parser.close()
+
+    Rows are parsed as soon as they are complete. Scanning for the end of
+    the current row resumes where the last fragment left off, so no data is
+    scanned twice; only the trailing incomplete row is held back.
+
+    Arguments:
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        usecols: list of str or Ref, optional
+            Columns to read; see `read`.
+        start, end: datetime-like, optional
+            Time range of rows to read; see `read`.
+    """
+
+    def __init__(
+            self,
+            tokenizer: Optional[str] = None,
+            usecols: Optional[Sequence[Union[str, Ref]]] = None,
+            start: Any = None,
+            end: Any = None):
+        self._tokenizer = tokenizer
+        self._usecols = usecols
+        self._start = start
+        self._end = end
+        self._buf = bytearray()
+        self._scanner = _RowScanner()
+        # Offsets just past the row ends found in _buf but not yet parsed
+        self._row_ends: List[int] = []
+        self._parser: Optional[ZincParser] = None
+        self._builder: Optional[GridBuilder] = None
+        self._closed: bool = False
+
+    def feed(self, data: bytes):
+        """Feeds the next fragment of UTF-8 encoded data."""
+        if self._closed:
+            raise ValueError("feed() called after close()")
+        self._buf += data
+        self._row_ends += self._scanner.scan(self._buf)
+        if self._parser is None:
+            if len(self._row_ends) < 2:
+                return
+            # The version line and the column definitions are complete
+            self._parse_header(self._row_ends[1])
+        if self._row_ends:
+            self._parse_rows(self._rows_stop())
+
+    def close(self) -> Grid:
+        """Parses any remaining data, and returns the Grid."""
+        if self._closed:
+            raise ValueError("close() called twice")
+        self._closed = True
+        if self._parser is None:
+            return ZincParser(
+                make_tokenizer(bytes(self._buf), self._tokenizer),
+                self._usecols, self._start, self._end).parse()
+        self._parse_rows(len(self._buf))
+        assert self._builder is not None
+        return self._builder.build()
+
+    def _parse_header(self, stop: int):
+        self._parser = ZincParser(
+            make_tokenizer(bytes(self._buf[:stop]), self._tokenizer),
+            self._usecols, self._start, self._end)
+        self._builder = self._parser._start_grid()
+        self._consume(stop)
+
+    def _rows_stop(self) -> int:
+        """Returns the end of the rows that can be parsed before close().
+
+        Trailing blank lines are held back, since whether they end the grid
+        or are an error depends on whether more rows follow them.
+        """
+        ends = [0] + self._row_ends
+        k = len(ends) - 1
+        while k > 0 and not self._buf[ends[k - 1]:ends[k]].strip():
+            k -= 1
+        return ends[k]
+
+    def _parse_rows(self, stop: int):
+        assert self._parser is not None and self._builder is not None
+        if stop and not self._parser._stopped:
+            tokenizer = make_tokenizer(
+                bytes(self._buf[:stop]), self._tokenizer)
+            for cells in self._parser.parse_rows(tokenizer):
+                self._builder.add_row(cells)
+        self._consume(stop)
+
+    def _consume(self, stop: int):
+        del self._buf[:stop]
+        self._scanner.pos -= stop
+        self._row_ends = [i - stop for i in self._row_ends if i > stop]
+
+
+def read_meta(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str] = None,
+        compression: Optional[str] = 'infer') -> GridHeader:
+    """Reads only the metadata of a Zinc file or buffer.
+
+    Parses the version line and the column definitions, then stops; no rows
+    are read, so the cost does not depend on the size of the grid.
+
+    Arguments:
+        filepath_or_buffer: str, path object, or file-like object
+            As for `read`.
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        compression: str, default 'infer'
+            Compression of the file or buffer; see `read`.
+    """
+    binary = tokenizer == 'regex'
+    with _handle_buf(filepath_or_buffer, binary, compression) as buf:
+        parser = ZincParser(make_tokenizer(buf, tokenizer))
+        try:
+            return parser.parse_header()
+        finally:
+            parser._tokenizer.close()
+
+
+def _read_chunks(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str],
+        mmap: bool,
+        chunksize: int,
+        usecols: Optional[Sequence[Union[str, Ref]]],
+        start: Any,
+        end: Any,
+        compression: Optional[str]) -> Iterator[Grid]:
+    binary = mmap or tokenizer == 'regex'
+    with _handle_buf(filepath_or_buffer, binary, compression) as buf:
+        mapped = _map_buf(buf) if mmap else None
+        if mapped is None:
+            yield from ZincParser(
+                make_tokenizer(buf, tokenizer), usecols, start,
+                end).parse_chunks(chunksize)
+            return
+        with mapped:
+            yield from ZincParser(
+                make_tokenizer(mapped, tokenizer), usecols, start,
+                end).parse_chunks(chunksize)
+
+
+def iter_rows(
+        filepath_or_buffer: FilePathOrBuffer,
+        tokenizer: Optional[str] = None,
+        usecols: Optional[Sequence[Union[str, Ref]]] = None,
+        start: Any = None,
+        end: Any = None,
+        compression: Optional[str] = 'infer',
+) -> Iterator[Union[GridHeader, Tuple[Scalar, ...]]]:
+    """Reads a Zinc file or buffer one row at a time.
+
+    No DataFrame is built, and only the current row is held in memory, so
+    arbitrarily large grids can be processed.
+
+    Arguments:
+        filepath_or_buffer: str, path object, or file-like object
+            As for `read`.
+        tokenizer: str, optional
+            Tokenizer engine to use; see `read`.
+        usecols: list of str or Ref, optional
+            Columns to read; see `read`.
+        start, end: datetime-like, optional
+            Time range of rows to read; see `read`.
+        compression: str, default 'infer'
+            Compression of the file or buffer; see `read`.
+    Yields:
+        First a GridHeader with the version, grid metadata and column
+        metadata, then one tuple of Scalars per row, in column order.
+    """
+    binary = tokenizer == 'regex'
+    with _handle_buf(filepath_or_buffer, binary, compression) as buf:
+        parser = ZincParser(
+            make_tokenizer(buf, tokenizer), usecols, start, end)
+        try:
+            yield parser.parse_header()
+            for cells in parser.iter_rows():
+                yield tuple(cells)
+            parser._verify_end()
+        finally:
+            parser._tokenizer.close()
+
+
+def _select_columns(
+        column_info: Dict[str, Dict[str, Scalar]],
+        usecols: Sequence[Union[str, Ref]]) -> List[int]:
+    """Resolves usecols to the sorted positions of the selected columns."""
+    lookup: Dict[str, int] = {}
+    for i, (colname, col_meta) in enumerate(column_info.items()):
+        lookup[colname] = i
+        ref = col_meta.get(ID_COLTAG)
+        if isinstance(ref, Ref):
+            lookup[ref.uid] = i
+            lookup['@' + ref.uid] = i
+            lookup[str(ref)] = i
+    positions = {lookup['ts']} if 'ts' in lookup else set()
+    for col in usecols:
+        key = col.uid if isinstance(col, Ref) else col
+        if key not in lookup:
+            raise ValueError(f"usecols refers to an unknown column: {col}")
+        positions.add(lookup[key])
+    return sorted(positions)
+
+
+def _handle_buf(
+        filepath_or_buffer: FilePathOrBuffer,
+        binary: bool,
+        compression: Optional[str] = None) -> IO:
+    compression = _infer_compression(filepath_or_buffer, compression)
+    if compression is not None:
+        return _open_compressed(
+            filepath_or_buffer, compression, 'rb' if binary else 'rt')
+    if hasattr(filepath_or_buffer, 'read'):
+        return filepath_or_buffer  # type: ignore
+    if binary:
+        return open(filepath_or_buffer, 'rb')  # type: ignore
     return open(filepath_or_buffer, encoding="utf-8")
 
 
+def _map_buf(buf: IO) -> Optional[mmap_module.mmap]:
+    """Maps a binary file into memory, or returns None if it can't be."""
+    if not isinstance(buf, (io.BufferedReader, io.FileIO)):
+        return None
+    try:
+        if not buf.seekable() or buf.tell() != 0:
+            return None
+        return mmap_module.mmap(
+            buf.fileno(), 0, access=mmap_module.ACCESS_READ)
+    except (OSError, ValueError):
+        # e.g. empty files, which cannot be mapped
+        return None
+
+
 class ZincParser:
     """ZincParser parses a Zinc-format string into a Grid."""
 
-    def __init__(self, tokenizer: ZincTokenizer):
+    def __init__(
+            self,
+            tokenizer: ZincTokenizer,
+            usecols: Optional[Sequence[Union[str, Ref]]] = None,
+            start: Any = None,
+            end: Any = None):
         self._tokenizer: ZincTokenizer = tokenizer
+        self._usecols = usecols
+        self._time_range: Optional[_TimeRange] = None
+        if start is not None or end is not None:
+            self._time_range = _TimeRange(start, end)
+        # Set once the rows past the time range are known to be unneeded, so
+        # that the rest of the input is left unread
+        self._stopped: bool = False
+        # Positions of the columns to read, or None to read them all
+        self._col_positions: Optional[List[int]] = None
+        # Decoders of the cells of simple rows, per column read
+        self._decoders: List[CellDecoder] = []
+        # Whether numbers of typed columns are decoded to ints and floats,
+        # rather than to Numbers
+        self._primitive: bool = False
         self._cur: Token = tokens.EOF
-        self._peek: Token = tokens.EOF
+        # Lookahead token, only read from the tokenizer when needed
+        self._peek: Optional[Token] = None
         self._cur_line: int = 0
-        self._peek_line: int = 0
         self._version: int = 3
-        self._consume()
+        self._num_cols: int = 0
         self._consume()
 
     def parse(self, close: Optional[bool] = True) -> Grid:
         try:
             grid = self._parse_grid()
-            self._verify_eq(tokens.EOF)
+            self._verify_end()
             return grid
         finally:
-            self._tokenizer._buf.close()
+            self._tokenizer.close()
 
-    def _parse_grid(self) -> Grid:
+    def parse_chunks(self, chunksize: int) -> Iterator[Grid]:
+        """Parses the grid into Grids of at most chunksize rows each.
+
+        A grid without rows still yields one (empty) Grid. The kinds of
+        columns without a kind tag are inferred from the first chunk, and
+        kept for the rest, so that every chunk has the same dtypes.
+        """
+        try:
+            gb = self._start_grid()
+            flushed = False
+            for cells in self.iter_rows():
+                gb.add_row(cells)
+                if gb.num_rows >= chunksize:
+                    if not flushed:
+                        gb.inferred_kinds = {
+                            colname: _infer_kind(gb.cols[colname])
+                            for i, (colname, col_meta)
+                            in enumerate(gb.col_meta.items())
+                            if i > 0 and KIND_COLTAG not in col_meta}
+                    flushed = True
+                    yield gb.flush()
+            self._verify_end()
+            if gb.num_rows or not flushed:
+                yield gb.flush()
+        finally:
+            self._tokenizer.close()
+
+    def parse_header(self) -> GridHeader:
+        """Parses the version line and the column definitions."""
         def _check_version(s: String):
             if s == String('3.0'):
                 return 3
@@ -102,58 +1057,155 @@ class ZincParser:
         self._consume()
         self._consume_i(tokens.COLON)
 
-        gb = GridBuilder(_check_version(self._consume_str()))
+        version = _check_version(self._consume_str())
 
         # Grid meta
+        grid_meta: Dict[str, Scalar] = {}
         if self._cur.ttype is TokenType.ID:
             grid_meta = self._parse_dict()
             # Check for errors
             if 'err' in grid_meta:
                 raise ZincErrorGridException("Error grid received")
-            gb.add_meta(grid_meta)
         self._consume_i(tokens.NEWLINE)
 
         # Column definitions
-        num_cols: int = 0
+        column_info: Dict[str, Dict[str, Scalar]] = {}
         while self._cur.ttype is TokenType.ID:
-            num_cols += 1
             colname: str = self._consume_tag_id()
             col_meta: Dict[str, Scalar] = {}
             if self._cur.ttype is TokenType.ID:
                 col_meta = self._parse_dict()
-            gb.add_col(colname, col_meta)
+            column_info[colname] = col_meta
             if self._cur is not tokens.COMMA:
                 break
             self._consume_i(tokens.COMMA)
-        if num_cols == 0:
+        if not column_info:
             raise ZincParseException("No columns defined")
-        self._consume_i(tokens.NEWLINE)
+        self._verify_eq(tokens.NEWLINE)
+        self._num_cols = len(column_info)
+        if self._time_range is not None:
+            if next(iter(column_info)) != 'ts':
+                raise ZincParseException(
+                    "start and end require 'ts' to be the first column")
+        if self._usecols is not None:
+            self._col_positions = _select_columns(column_info, self._usecols)
+            column_info = {
+                colname: col_meta
+                for i, (colname, col_meta) in enumerate(column_info.items())
+                if i in self._col_positions}
+        self._decoders = [
+            _column_decoder(colname, col_meta, self._primitive)
+            for colname, col_meta in column_info.items()]
 
-        # Grid rows
-        while True:
-            if self._cur in (tokens.NEWLINE, tokens.EOF):
+        return GridHeader(
+            version=version, grid_info=grid_meta, column_info=column_info)
+
+    def iter_rows(self) -> Iterator[List[Scalar]]:
+        """Parses the rows following the header, one at a time."""
+        num_cols = self._num_cols
+        positions = self._col_positions
+        selected = (None if positions is None
+                    else [i in positions for i in range(num_cols)])
+        time_range = self._time_range
+        while not self._stopped:
+            # self._cur is the NEWLINE ending the previous line, and nothing
+            # past it has been tokenized yet. Decode simple rows straight from
+            # the raw line; anything else goes through the tokenizer.
+            if self._peek is None:
+                line = self._tokenizer.peek_line()
+                if line and time_range is not None:
+                    where = time_range.locate(line)
+                    if where == -1:
+                        self._tokenizer.skip_line()
+                        continue
+                    if where == 1:
+                        self._stopped = True
+                        return
+                if line:
+                    simple_cells = _decode_simple_row(
+                        line, num_cols, self._decoders, positions)
+                    if simple_cells is not None:
+                        self._tokenizer.skip_line()
+                        yield simple_cells
+                        continue
+            self._consume()
+            if self._cur is tokens.NEWLINE or self._cur is tokens.EOF:
                 break
+            if (time_range is not None and
+                    self._cur.ttype is TokenType.DATETIME):
+                where = time_range.locate(self._cur.val)
+                if where == 1:
+                    self._stopped = True
+                    return
+                if where == -1:
+                    self._skip_row()
+                    if self._cur is tokens.EOF:
+                        break
+                    continue
 
             # read cells
             cells: List[Scalar] = []
             for i in range(num_cols):
-                if self._cur in (tokens.COMMA, tokens.NEWLINE, tokens.EOF):
+                cur = self._cur
+                if selected is not None and not selected[i]:
+                    self._skip_val()
+                elif (cur is tokens.COMMA or cur is tokens.NEWLINE or
+                        cur is tokens.EOF):
                     cells.append(NULL)
                 else:
                     cells.append(self._parse_val())
                 if i + 1 < num_cols:
                     self._consume_i(tokens.COMMA)
-            gb.add_row(cells)
+            yield cells
 
             if self._cur is tokens.EOF:
                 break
-            self._consume_i(tokens.NEWLINE)
+            self._verify_eq(tokens.NEWLINE)
 
-        if self._cur is tokens.NEWLINE:
+        if self._cur is tokens.NEWLINE and not self._stopped:
             self._consume_i(tokens.NEWLINE)
 
+    def parse_rows(self, tokenizer: ZincTokenizer) -> Iterator[List[Scalar]]:
+        """Parses further rows from another tokenizer.
+
+        Lets rows that arrive in batches be parsed after parse_header, with
+        a tokenizer per batch. Each batch must hold whole rows.
+        """
+        self._tokenizer = tokenizer
+        self._cur = tokens.NEWLINE
+        self._peek = None
+        yield from self.iter_rows()
+        self._verify_end()
+
+    def _verify_end(self):
+        """Checks that the whole input was parsed, unless stopped early."""
+        if not self._stopped:
+            self._verify_eq(tokens.EOF)
+
+    def _parse_grid(self) -> Grid:
+        gb = self._start_grid()
+        for cells in self.iter_rows():
+            gb.add_row(cells)
         return gb.build()
 
+    def _start_grid(self) -> GridBuilder:
+        """Parses the header into a GridBuilder for the rows to be added to.
+
+        The rows are then decoded for the builder: numbers of typed columns
+        come as ints and floats, which it stores in typed arrays, rather
+        than as Numbers.
+        """
+        self._primitive = True
+        return self._grid_builder(self.parse_header())
+
+    @staticmethod
+    def _grid_builder(header: GridHeader) -> GridBuilder:
+        gb = GridBuilder(header.version)
+        gb.add_meta(header.grid_info)
+        for colname, col_meta in header.column_info.items():
+            gb.add_col(colname, col_meta)
+        return gb
+
     def _parse_val(self) -> Scalar:
         if self._cur.ttype is TokenType.RESERVED:
             v = self._cur
@@ -206,7 +1258,7 @@ class ZincParser:
             raise NotImplementedError("XStr support not implemented yet!")
 
         # -INF
-        if self._cur is tokens.MINUS and self._peek.val == "INF":
+        if self._cur is tokens.MINUS and self._peek_token().val == "INF":
             self._consume_i(tokens.MINUS)
             self._consume_t(TokenType.ID)
             raise NotImplementedError("No NEG_INF yet!")
@@ -227,6 +1279,29 @@ class ZincParser:
 
         raise ZincParseException(f"Unexpected token: {self._cur}")
 
+    def _skip_row(self):
+        """Consumes the tokens of a row, up to its NEWLINE or EOF."""
+        while True:
+            self._skip_val()
+            if self._cur is not tokens.COMMA:
+                return
+            self._consume_i(tokens.COMMA)
+
+    def _skip_val(self):
+        """Consumes the tokens of a cell without building its value."""
+        depth = 0
+        while True:
+            cur = self._cur
+            if cur is tokens.EOF:
+                return
+            if depth == 0 and (cur is tokens.COMMA or cur is tokens.NEWLINE):
+                return
+            if cur in _OPENERS:
+                depth += 1
+            elif cur in _CLOSERS:
+                depth -= 1
+            self._consume()
+
     def _parse_coord(self) -> Coord:
         v = self._cur.val
         try:
@@ -261,19 +1336,19 @@ class ZincParser:
 
     def _parse_datetime(self) -> Datetime:
         parts = self._cur.val.split(" ")
-        ts = pd.to_datetime(parts[0])
         self._consume()
         if len(parts) == 2:
             # we have a timestamp and a tz
-            return Datetime(ts, parts[1])
+            return Datetime.from_iso(parts[0], parts[1])
         if len(parts) == 1:
-            return Datetime(ts)
+            return Datetime.from_iso(parts[0])
         raise ZincParseException(f"Invalid datetime: {self._cur.val}")
 
     def _parse_list(self) -> List[Scalar]:
         coll: List[Scalar] = []
         self._consume_i(tokens.LBRACKET)
-        while self._cur != tokens.RBRACKET and self._cur != tokens.EOF:
+        while (self._cur is not tokens.RBRACKET and
+               self._cur is not tokens.EOF):
             val = self._parse_val()
             coll.append(val)
             if self._cur is not tokens.COMMA:
@@ -320,7 +1395,8 @@ class ZincParser:
                 f"Expected {type(expected)} but found {type(self._cur)}")
 
     def _verify_eq(self, expected: tokens.Token) -> None:
-        if self._cur != expected:
+        # Fixed tokens are singletons, so identity suffices
+        if self._cur is not expected:
             raise ZincParseException(
                 f"Expected {expected} but found {self._cur}")
 
@@ -332,9 +1408,15 @@ class ZincParser:
         self._verify_eq(expected)
         self._consume()
 
-    def _consume(self) -> None:
-        self._cur = self._peek
-        self._cur_line = self._peek_line
+    def _peek_token(self) -> Token:
+        if self._peek is None:
+            self._peek = next(self._tokenizer)
+        return self._peek
 
-        self._peek = next(self._tokenizer)
-        self._peek_line = self._tokenizer.line
+    def _consume(self) -> None:
+        if self._peek is not None:
+            self._cur = self._peek
+            self._peek = None
+        else:
+            self._cur = next(self._tokenizer)
+        self._cur_line = self._tokenizer.line
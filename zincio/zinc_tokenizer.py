@@ -1,12 +1,27 @@
+import functools
 import io
+import mmap
+import re
 
-from typing import Iterable, Iterator, IO, List
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, IO, List, Match, NoReturn,
+    Optional, Type, Union,
+)
 
 from . import tokens
 from .tokens import NumberToken, Token, TokenType
 
 EOF = 'EOF'
 
+# Number of characters pulled from the underlying buffer at a time
+CHUNK_SIZE = 64 * 1024
+
+_ID_PART_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+_LETTER_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_DIGIT_CHARS = frozenset('0123456789')
+
 
 class ZincTokenizerException(Exception):
     """An exception indicating that the string could not be tokenized."""
@@ -29,14 +44,22 @@ def _is_id_part(c: str) -> bool:
     return _is_letter(c) or _is_digit(c) or c == '_'
 
 
-def tokenize(s: str) -> Iterable[Token]:
-    """Tokenize a Zinc string."""
-    return tokenize_buf(io.StringIO(s))
+def _is_unit(c: str) -> bool:
+    return c != EOF and (c in ('%', '$', '/') or ord(c) > 128)
+
 
+def tokenize(
+        s: Union[str, bytes],
+        tokenizer: Optional[str] = None) -> Iterable[Token]:
+    """Tokenize a Zinc string, or UTF-8 encoded bytes."""
+    if isinstance(s, str):
+        return tokenize_buf(io.StringIO(s), tokenizer)
+    return tokenize_buf(s, tokenizer)
 
-def tokenize_buf(buf: IO) -> Iterable[Token]:
+
+def tokenize_buf(buf: Any, tokenizer: Optional[str] = None) -> Iterable[Token]:
     """Tokenize a Zinc buffer."""
-    tkzr = ZincTokenizer(buf)
+    tkzr = make_tokenizer(buf, tokenizer)
     while True:
         tok = next(tkzr)
         yield tok
@@ -52,22 +75,30 @@ class ZincTokenizer(Iterator[Token]):
     FMI: https://project-haystack.org/doc/Zinc
     """
 
-    def __init__(self, buf: IO) -> None:
+    _EMPTY: Any = ''
+    _NEWLINE: Any = '\n'
+
+    def __init__(self, buf: IO, chunk_size: int = CHUNK_SIZE) -> None:
         self._buf: IO = buf
+        self._chunk_size: int = chunk_size
+        # The current block of input, and the index of self._cur within it.
+        # Everything before self._pos has been consumed and may be discarded.
+        self._chunk: Any = self._EMPTY
+        self._pos: int = 0
+        self._eof: bool = False
         self._cur: str = ''
         self._peek: str = ''
         self.line: int = 0
-        self._consume()
-        self._consume()
+        # End of the line last returned by peek_line()
+        self._line_end: int = 0
+        self._fill()
+        self._seek(0)
 
     def __next__(self) -> Token:
         # skip non-meaningful whitespace
-        while True:
-            if self._cur in (' ', '\t', '\xa0'):
-                self._consume()
-                continue
-            # TODO: skip comments?
-            break
+        # TODO: skip comments?
+        if self._cur in (' ', '\t', '\xa0'):
+            self._take_while(' \t\xa0')
 
         if self._cur in ('\n', '\r'):
             if self._cur == '\r' and self._peek == '\n':
@@ -97,12 +128,47 @@ class ZincTokenizer(Iterator[Token]):
         # otherwise, symbol
         return self._tokenize_symbol()
 
+    def peek_line(self) -> Optional[str]:
+        """Returns the raw text of the rest of the current line.
+
+        Nothing is consumed; call skip_line() to move past the line. Returns
+        None at the end of input.
+        """
+        while True:
+            nl = self._find_newline(self._pos)
+            if nl >= 0 or not self._fill():
+                break
+        if nl < 0:
+            if self._pos >= len(self._chunk):
+                return None
+            nl = len(self._chunk)
+        self._line_end = nl
+        line = self._line_text(self._pos, nl)
+        if line.endswith('\r'):
+            line = line[:-1]
+        return line
+
+    def skip_line(self) -> None:
+        """Consumes the line last returned by peek_line(), and its newline."""
+        if self._line_end < len(self._chunk):
+            self.line += 1
+            self._seek(self._line_end + 1)
+        else:
+            self._seek(self._line_end)
+
+    def close(self) -> None:
+        """Closes the underlying buffer, if any."""
+        if self._buf is not None:
+            self._buf.close()
+
+    def _find_newline(self, pos: int) -> int:
+        return self._chunk.find('\n', pos)
+
+    def _line_text(self, start: int, end: int) -> str:
+        return self._chunk[start:end]
+
     def _tokenize_id(self) -> Token:
-        s = []
-        while self._cur != EOF and _is_id_part(self._cur):
-            s.append(self._cur)
-            self._consume()
-        return Token(TokenType.ID, ''.join(s))
+        return Token(TokenType.ID, self._take_while(_ID_PART_CHARS))
 
     def _tokenize_coord(self) -> Token:
         s = ['C', '(']
@@ -138,11 +204,7 @@ class ZincTokenizer(Iterator[Token]):
         return v
 
     def _tokenize_reserved(self) -> Token:
-        s = []
-        while self._cur != EOF and _is_letter(self._cur):
-            s.append(self._cur)
-            self._consume()
-        v = ''.join(s)
+        v = self._take_while(_LETTER_CHARS)
         if v == 'N':
             return tokens.NULL
         if v == 'M':
@@ -163,61 +225,79 @@ class ZincTokenizer(Iterator[Token]):
         raise ZincTokenizerException(f"Invalid token {v}")
 
     def _tokenize_num(self) -> Token:
-        def _is_unit(c: str):
-            return c != EOF and (c in ('%', '$', '/') or ord(c) > 128)
         if self._cur == '0' and self._peek == 'x':
             self._tokenize_hex()
 
-        # consume all things that might be part of this number token
+        # consume all things that might be part of this number token, scanning
+        # the current block by index
         s: List[str] = []
+        length = 0
         colons = 0
         dashes = 0
         unit_index = 0
         exp = False
+        chunk = self._chunk
+        i = seg = self._pos
+        n = len(chunk)
         while True:
-            if self._cur is EOF:
+            while i + 1 >= n and not self._eof:
+                # need the character after i; carry the token into next block
+                s.append(chunk[seg:i])
+                length += i - seg
+                self._pos = i
+                self._fill()
+                chunk = self._chunk
+                i = seg = self._pos
+                n = len(chunk)
+            if i >= n:
                 break
-            if not _is_digit(self._cur):
-                if exp and (self._cur in ('+', '-')):
+            c = chunk[i]
+            if c not in _DIGIT_CHARS:
+                peek = chunk[i + 1] if i + 1 < n else EOF
+                if exp and (c in ('+', '-')):
                     # this is exponent notation
                     pass
-                elif self._cur == '-':
+                elif c == '-':
                     dashes += 1
-                elif self._cur == ':' and _is_digit(self._peek):
+                elif c == ':' and peek in _DIGIT_CHARS:
                     colons += 1
-                elif ((exp or colons >= 1) and self._cur == '+'):
+                elif ((exp or colons >= 1) and c == '+'):
                     pass
-                elif self._cur == '.':
-                    if not _is_digit(self._peek):
+                elif c == '.':
+                    if peek not in _DIGIT_CHARS:
                         break
-                elif (self._cur in ('e', 'E') and
-                      (self._peek in ('-', '+') or _is_digit(self._peek))):
+                elif (c in ('e', 'E') and
+                      (peek in ('-', '+') or peek in _DIGIT_CHARS)):
                     exp = True
-
-                elif _is_letter(self._cur) or _is_unit(self._cur):
+                elif c in _LETTER_CHARS or _is_unit(c):
                     if unit_index == 0:
-                        unit_index = len(s)
-                elif self._cur == '_':
-                    if unit_index == 0 and _is_digit(self._peek):
-                        self._consume()
+                        unit_index = length + i - seg
+                elif c == '_':
+                    if unit_index == 0 and peek in _DIGIT_CHARS:
+                        # digit separator; drop it
+                        s.append(chunk[seg:i])
+                        length += i - seg
+                        i += 1
+                        seg = i
                         continue
                     elif unit_index == 0:
-                        unit_index = len(s)
+                        unit_index = length + i - seg
                 else:
                     # done with the number
                     break
-
-            s.append(self._cur)
-            self._consume()
+            i += 1
+        s.append(chunk[seg:i])
+        self._seek(i)
+        v = ''.join(s)
 
         if dashes == 2 and colons == 0:
-            return Token(TokenType.DATE, ''.join(s))
+            return Token(TokenType.DATE, v)
         if dashes == 0 and colons >= 1:
-            return self._tokenize_as_time(''.join(s), 1)
+            return self._tokenize_as_time(v, 1)
         if dashes >= 2:
-            return self._tokenize_as_datetime(''.join(s))
+            return self._tokenize_as_datetime(v)
 
-        return NumberToken(''.join(s), unit_index)
+        return NumberToken(v, unit_index)
 
     def _tokenize_hex(self) -> Token:
         self._consume('0')
@@ -253,32 +333,40 @@ class ZincTokenizer(Iterator[Token]):
             raise ZincTokenizerException("Expecting timezone!")
         self._consume()
         tz.append(' ')
-        while _is_id_part(self._cur):
+        tz.append(self._take_while(_ID_PART_CHARS))
+        if self._cur in ('+', '-') and tz[-1].endswith('GMT'):
             tz.append(self._cur)
             self._consume()
-
-            if self._cur in '+-' and ''.join(tz).endswith('GMT'):
-                tz.append(self._cur)
-                self._consume()
-                while _is_digit(self._cur):
-                    tz.append(self._cur)
-                    self._consume()
+            tz.append(self._take_while(_DIGIT_CHARS))
         return ''.join(tz)
 
     def _tokenize_str(self) -> Token:
         self._consume('"')
         s = []
         while True:
-            if self._cur == EOF:
-                raise ZincTokenizerException("Unexpected end of str")
-            if self._cur == '"':
-                self._consume('"')
-                break
-            if self._cur == '\\':
+            # Copy everything up to the next quote or escape in one slice
+            chunk = self._chunk
+            start = self._pos
+            end = len(chunk)
+            quote = chunk.find('"', start)
+            if quote >= 0:
+                end = quote
+            backslash = chunk.find('\\', start, end)
+            if backslash >= 0:
+                end = backslash
+            s.append(chunk[start:end])
+            if end == len(chunk):
+                # string continues past the end of this block
+                self._pos = end
+                if not self._fill():
+                    raise ZincTokenizerException("Unexpected end of str")
+                continue
+            self._seek(end)
+            if end == backslash:
                 s.append(self._escape())
                 continue
-            s.append(self._cur)
-            self._consume()
+            self._consume('"')
+            break
         return Token(TokenType.STRING, ''.join(s))
 
     def _tokenize_ref(self) -> Token:
@@ -402,9 +490,338 @@ class ZincTokenizer(Iterator[Token]):
         if expected is not None and self._cur != expected:
             raise ZincTokenizerException(
                 f"Expected {expected} but found {self._cur}")
+        self._cur = self._peek
+        self._pos += 1
+        if self._pos + 1 < len(self._chunk) or self._fill():
+            self._peek = self._chunk[self._pos + 1]
+        else:
+            self._peek = EOF
+
+    def _take_while(self, chars) -> str:
+        """Consumes and returns the longest run of characters in chars."""
+        s = []
+        while True:
+            chunk = self._chunk
+            start = self._pos
+            end = start
+            n = len(chunk)
+            while end < n and chunk[end] in chars:
+                end += 1
+            s.append(chunk[start:end])
+            self._pos = end
+            if end < n or not self._fill():
+                break
+        self._seek(self._pos)
+        return ''.join(s)
+
+    def _seek(self, pos: int) -> None:
+        """Moves self._cur to index pos of the current block."""
+        self._pos = pos
+        while pos + 1 >= len(self._chunk) and self._fill():
+            pos = self._pos
+        chunk = self._chunk
+        n = len(chunk)
+        self._cur = chunk[pos] if pos < n else EOF
+        self._peek = chunk[pos + 1] if pos + 1 < n else EOF
+
+    def _fill(self) -> bool:
+        """Reads the next block from the buffer, discarding consumed input.
+
+        Returns whether any new input was read.
+        """
+        if self._eof:
+            return False
         try:
-            self._cur = self._peek
-            self._peek = self._buf.read(1) or EOF
+            data = self._buf.read(self._chunk_size)
         except Exception:
-            self._cur = EOF
-            self._peek = EOF
+            data = self._EMPTY
+        if not data:
+            self._eof = True
+            return False
+        self._chunk = self._chunk[self._pos:] + data
+        self._pos = 0
+        return True
+
+
+_SIMPLE_ESCAPES = frozenset('bfnrt"$\'`\\')
+_URI_ESCAPES = frozenset(':/?#[]@\\&=;')
+_ESCAPE = re.compile(r'\\(?:u(.{0,4})|([\s\S]))')
+
+
+def _unescape(s: str, keep=_SIMPLE_ESCAPES) -> str:
+    """Applies the same escape handling as ZincTokenizer._escape to s."""
+    if '\\' not in s:
+        return s
+
+    def _replace(m: Match) -> str:
+        c = m.group(2)
+        if c is None:
+            hexits = m.group(1)
+            try:
+                return chr(int(hexits, base=16))
+            except ValueError:
+                raise ZincTokenizerException(
+                    f"Invalid unicode sequence: {hexits}")
+        if c in keep:
+            return m.group(0)
+        raise ZincTokenizerException(f"Invalid escape sequence: {c}")
+
+    return _ESCAPE.sub(_replace, s)
+
+
+_STR_BODY = r'[^"\\]*(?:\\[\s\S][^"\\]*)*'
+_TZ = r'\ [A-Z][a-zA-Z0-9_]*(?:(?<=GMT)[+-][0-9]*)?'
+
+# One alternative per token kind. Leading whitespace is folded into every
+# match, and `eof` only matches once the whole buffer has been read. The
+# whitespace and unit character classes differ between the str and the
+# (UTF-8) bytes flavors of the pattern.
+_MASTER_TEMPLATE = r"""
+    {ws}
+    (?:
+      (?P<sym><<|<=|>>|>=|->|==|!=|[,:;\[\]{{}}()<>=!/]|-(?![0-9]))
+    | (?P<datetime>
+        [0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}T[0-9]{{2}}:[0-9]{{2}}
+        (?::[0-9]{{2}}(?:\.[0-9]+)?)?(?:Z|[+-][0-9]{{2}}:[0-9]{{2}})?
+      )(?P<datetime_tz>{tz})?
+    | (?P<date>[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}})
+    | (?P<time>[0-9]{{1,2}}:[0-9]{{2}}(?::[0-9]{{2}}(?:\.[0-9]+)?)?)
+      (?P<time_tz>{tz})?
+    | (?P<hex>0x[0-9a-fA-F_]+)
+    | (?P<num>
+        -?[0-9](?:_(?=[0-9])|[0-9])*(?:\.[0-9](?:_(?=[0-9])|[0-9])*)?
+        (?:[eE][+-]?[0-9]+)?
+      )(?P<unit>[{unit}](?:[0-9{unit}]|\.(?=[0-9]))*)?
+    | (?P<nl>\r\n?|\n)
+    | (?P<id>[a-z][a-zA-Z0-9_]*)
+    | (?P<coord>C\((?P<lat>-?[0-9.]*),\ ?(?P<lng>-?[0-9.]*)\))
+    | (?P<reserved>[A-Z][a-zA-Z]*)
+    | "(?P<str>{str_body})"
+    | @(?P<ref>[a-zA-Z0-9_:.~-]*)(?:\ "(?P<ref_dis>{str_body})")?
+    | `(?P<uri>[^`\\\n]*(?:\\[\s\S][^`\\\n]*)*)`
+    | (?P<eof>\Z)
+    )"""
+
+_MASTER = re.compile(_MASTER_TEMPLATE.format(
+    ws=r'[ \t\xa0]*',
+    unit=r'a-zA-Z%$/_\x81-\U0010ffff',
+    tz=_TZ,
+    str_body=_STR_BODY,
+), re.VERBOSE)
+
+_MASTER_BYTES = re.compile(_MASTER_TEMPLATE.format(
+    ws=r'(?:[ \t]|\xc2\xa0)*',
+    unit=r'a-zA-Z%$/_\x80-\xff',
+    tz=_TZ,
+    str_body=_STR_BODY,
+).encode('ascii'), re.VERBOSE)
+
+_NEWLINE_BYTES = re.compile(b'\n')
+
+_SYMBOLS: Dict[str, Token] = {
+    tok.val: tok for tok in (
+        tokens.COMMA, tokens.COLON, tokens.SEMICOLON, tokens.LBRACKET,
+        tokens.RBRACKET, tokens.LBRACE, tokens.RBRACE, tokens.LPAREN,
+        tokens.RPAREN, tokens.LT, tokens.LTEQ, tokens.DOUBLELT, tokens.GT,
+        tokens.GTEQ, tokens.DOUBLEGT, tokens.ARROW, tokens.MINUS,
+        tokens.EQUALS, tokens.NOTEQUALS, tokens.ASSIGN, tokens.BANG,
+        tokens.SLASH,
+    )
+}
+
+_RESERVED: Dict[str, Token] = {
+    tok.val: tok for tok in (
+        tokens.NULL, tokens.MARKER, tokens.REMOVE, tokens.NA, tokens.NAN,
+        tokens.TRUE, tokens.FALSE, tokens.POS_INF,
+    )
+}
+
+
+class ZincRegexTokenizer(ZincTokenizer):
+    """Tokenizer for the Zinc format built on a single compiled regex.
+
+    Emits the same tokens as ZincTokenizer, but leaves the character-level
+    scanning to the regex engine. Every match starts on a line for which the
+    current block holds the terminating newline (or the end of input), so no
+    token other than a string can straddle a block boundary.
+    """
+
+    _master: Any = _MASTER
+    _symbols: Dict[Any, Token] = _SYMBOLS
+    _reserved: Dict[Any, Token] = _RESERVED
+    # Turns matched text into str
+    _decode: Callable[[Any], str] = str
+
+    def __init__(self, buf: IO, chunk_size: int = CHUNK_SIZE) -> None:
+        # Index of the last newline in the current block
+        self._limit: int = -1
+        super().__init__(buf, chunk_size)
+
+    def __next__(self) -> Token:
+        text = self._decode
+        while True:
+            pos = self._pos
+            if pos > self._limit and not self._eof:
+                self._fill()
+                continue
+            m = self._master.match(self._chunk, pos)
+            if m is None:
+                # possibly a string with a literal newline; read on
+                if self._fill():
+                    continue
+                self._raise_unmatched()
+            self._pos = m.end()
+            kind = m.lastgroup
+            if kind == 'sym':
+                return self._symbols[m.group(kind)]
+            if kind == 'num':
+                return NumberToken(text(m.group(kind)).replace('_', ''), 0)
+            if kind == 'unit':
+                num = text(m.group('num')).replace('_', '')
+                return NumberToken(num + text(m.group(kind)), len(num))
+            if kind == 'nl':
+                self.line += 1
+                return tokens.NEWLINE
+            if kind == 'datetime':
+                return Token(TokenType.DATETIME, text(m.group(kind)))
+            if kind == 'datetime_tz':
+                return Token(
+                    TokenType.DATETIME,
+                    text(m.group('datetime')) + text(m.group(kind)))
+            if kind == 'id':
+                return Token(TokenType.ID, text(m.group(kind)))
+            if kind == 'reserved':
+                v = m.group(kind)
+                if v not in self._reserved:
+                    raise ZincTokenizerException(f"Invalid token {text(v)}")
+                return self._reserved[v]
+            if kind == 'str':
+                return Token(TokenType.STRING, _unescape(text(m.group(kind))))
+            if kind == 'ref':
+                return Token(TokenType.REF, text(m.group(kind)))
+            if kind == 'ref_dis':
+                return Token(
+                    TokenType.REF,
+                    f'{text(m.group("ref"))} '
+                    f'"{_unescape(text(m.group(kind)))}"')
+            if kind == 'uri':
+                return Token(
+                    TokenType.URI,
+                    _unescape(text(m.group(kind)), _URI_ESCAPES))
+            if kind == 'date':
+                return Token(TokenType.DATE, text(m.group(kind)))
+            if kind == 'time_tz':
+                v = text(m.group('time'))
+                if v[1] == ':':
+                    v = '0' + v
+                return Token(TokenType.TIME, v + text(m.group(kind)))
+            if kind == 'time':
+                raise ZincTokenizerException(
+                    f"Invalid time token {text(m.group(kind))}")
+            if kind == 'coord':
+                lat, lng = text(m.group('lat')), text(m.group('lng'))
+                for v in (lat, lng):
+                    if v.count('.') > 1:
+                        raise ZincTokenizerException(f"Invalid float {v}")
+                return Token(TokenType.COORD, f'C({lat},{lng})')
+            if kind == 'hex':
+                return Token(
+                    TokenType.HEX, text(m.group(kind))[2:].replace('_', ''))
+            return tokens.EOF
+
+    def _raise_unmatched(self) -> NoReturn:
+        rest = self._line_text(self._pos, self._pos + 64).lstrip(' \t\xa0')
+        if rest.startswith('"'):
+            raise ZincTokenizerException("Unexpected end of str")
+        if rest.startswith('`'):
+            raise ZincTokenizerException("Unexpected end of URI")
+        raise ZincTokenizerException(f"Unexpected symbol: '{rest[:1]}'")
+
+    def _fill(self) -> bool:
+        if not super()._fill():
+            return False
+        self._limit = self._chunk.rfind(self._NEWLINE)
+        return True
+
+
+class ZincBytesTokenizer(ZincRegexTokenizer):
+    """Regex tokenizer that works directly on UTF-8 encoded bytes.
+
+    Accepts either a binary file-like object, which is read in blocks, or a
+    bytes-like object (bytes, bytearray, memoryview, mmap), which is scanned
+    in place without copying. Only the text of each token is decoded, so the
+    payload as a whole is never converted to str.
+    """
+
+    _master = _MASTER_BYTES
+    _symbols = {k.encode(): v for k, v in _SYMBOLS.items()}
+    _reserved = {k.encode(): v for k, v in _RESERVED.items()}
+    _decode = functools.partial(str, encoding='utf-8')
+    _EMPTY = b''
+    _NEWLINE = b'\n'
+
+    def __init__(self, source: Any, chunk_size: int = CHUNK_SIZE) -> None:
+        # A bytes-like source becomes the one and only block
+        self._data: Any = None
+        if not hasattr(source, 'read'):
+            self._data = source
+            source = None
+        super().__init__(source, chunk_size)
+
+    def _find_newline(self, pos: int) -> int:
+        # memoryview has no find(), but the regex engine accepts any buffer
+        m = _NEWLINE_BYTES.search(self._chunk, pos)
+        return -1 if m is None else m.start()
+
+    def _line_text(self, start: int, end: int) -> str:
+        return str(self._chunk[start:end], 'utf-8', 'replace')
+
+    def _fill(self) -> bool:
+        if self._data is not None:
+            self._chunk = self._data
+            self._data = None
+            self._pos = 0
+            self._eof = True
+            return True
+        return super()._fill()
+
+
+TOKENIZERS: Dict[str, Type[ZincTokenizer]] = {
+    'char': ZincTokenizer,
+    'regex': ZincRegexTokenizer,
+}
+
+_BYTES_LIKE = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def is_binary(source: Any) -> bool:
+    """Whether source is a bytes-like object or a binary file-like object."""
+    return (isinstance(source, _BYTES_LIKE + (io.RawIOBase, io.BufferedIOBase))
+            or 'b' in getattr(source, 'mode', ''))
+
+
+def make_tokenizer(
+        source: Any, tokenizer: Optional[str] = None) -> ZincTokenizer:
+    """Constructs the named tokenizer engine over source.
+
+    Arguments:
+        source: file-like object to be tokenized, or a bytes-like object.
+        tokenizer: name of the engine, one of TOKENIZERS. Defaults to 'char'
+            for text and 'regex' for binary sources. The 'regex' engine scans
+            binary sources without decoding them; the 'char' engine decodes
+            them first.
+    """
+    binary = is_binary(source)
+    if tokenizer is None:
+        tokenizer = 'regex' if binary else 'char'
+    if tokenizer not in TOKENIZERS:
+        raise ValueError(
+            f"Unknown tokenizer {tokenizer}; "
+            f"expected one of {', '.join(TOKENIZERS)}")
+    if binary and tokenizer == 'regex':
+        return ZincBytesTokenizer(source)
+    if isinstance(source, _BYTES_LIKE):
+        source = io.StringIO(str(source, 'utf-8'))
+    elif binary:
+        source = io.TextIOWrapper(source, encoding='utf-8')
+    return TOKENIZERS[tokenizer](source)
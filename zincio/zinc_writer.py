@@ -0,0 +1,129 @@
+import csv
+import pandas as pd  # type: ignore
+
+from typing import Any, Dict, IO, List, Sequence
+
+from .grid import (
+    TZ_COLTAG,
+    UNIT_COLTAG,
+    _column_info_str,
+    _format_rows,
+    _grid_info_str,
+    _iana_tz,
+)
+
+
+class ZincWriter:
+    """Writes a Zinc grid to an open text stream, some rows at a time.
+
+    The version line and the column definitions are written once, when the
+    writer is created; rows can then be appended as they become available,
+    e.g. by a logger that flushes every few minutes:
+
+        with open("trend.zinc", "w", encoding="utf-8") as f:
+            writer = ZincWriter(f, grid_info, column_info)
+            writer.write_row(ts, [72.5, 0.3])
+            ...
+            writer.flush()
+
+    Rows are formatted as by Grid.to_zinc. The units of the columns and the
+    tz of the ts column are looked up once, so the cost of each write only
+    depends on the rows written.
+
+    Arguments:
+        fp: text file object, open for writing.
+        grid_info: A Dict[str, Any] of grid-level metadata, as in Grid.
+        column_info: A Dict[str, Dict[str, Any]] of metadata about each
+            column, as in Grid. The first column must be 'ts'.
+        version: int, default 3
+            The version of Zinc to write.
+        buffer_rows: int, default 1000
+            Number of rows write_row holds back, to be formatted together,
+            before writing them.
+    """
+
+    def __init__(
+            self,
+            fp: IO[str],
+            grid_info: Dict[str, Any],
+            column_info: Dict[str, Dict[str, Any]],
+            version: int = 3,
+            buffer_rows: int = 1000):
+        if next(iter(column_info), None) != 'ts':
+            raise ValueError("The first column must be 'ts'")
+        if buffer_rows < 1:
+            raise ValueError(
+                f"buffer_rows must be positive, not {buffer_rows}")
+        colinfos = list(column_info.values())
+        self._fp = fp
+        self._writer = csv.writer(fp, lineterminator="\n")
+        self._tz = colinfos[0].get(TZ_COLTAG)
+        self._iana = _iana_tz(str(self._tz)) if self._tz is not None else None
+        self._units = [colinfo.get(UNIT_COLTAG) for colinfo in colinfos[1:]]
+        self._buffer_rows = buffer_rows
+        # Rows passed to write_row, but not yet written
+        self._ts: List[Any] = []
+        self._rows: List[Sequence[Any]] = []
+        fp.write(_grid_info_str(version, grid_info))
+        fp.write("\n")
+        fp.write(_column_info_str(column_info))
+        fp.write("\n")
+
+    def write_row(self, ts: Any, values: Sequence[Any]):
+        """Appends a row, given its ts and the values of the other columns.
+
+        The row is buffered; flush() writes it out. ts may be anything
+        pd.to_datetime accepts, and is taken to be UTC if timezone-naive. It
+        is written in the tz of the ts column, if known.
+        """
+        if len(values) != len(self._units):
+            raise ValueError(
+                f"Expected {len(self._units)} values, not {len(values)}")
+        self._ts.append(ts)
+        self._rows.append(values)
+        if len(self._rows) >= self._buffer_rows:
+            self._write_buffered()
+
+    def write_rows(self, data: pd.DataFrame):
+        """Appends the rows of a DataFrame indexed by ts, as in Grid.data.
+
+        Any rows buffered by write_row are written first. The index is
+        converted as the ts of write_row is.
+        """
+        if len(data.columns) != len(self._units):
+            raise ValueError(
+                f"Expected {len(self._units)} columns, "
+                f"not {len(data.columns)}")
+        self._write_buffered()
+        self._write(
+            self._localize(data.index),
+            [series for _, series in data.items()])
+
+    def flush(self):
+        """Writes out the buffered rows, and flushes the stream."""
+        self._write_buffered()
+        self._fp.flush()
+
+    def _write_buffered(self):
+        if not self._rows:
+            return
+        idx = self._localize(self._ts)
+        columns = [pd.Series(list(col)) for col in zip(*self._rows)]
+        self._ts = []
+        self._rows = []
+        self._write(idx, columns)
+
+    def _localize(self, ts: Any) -> pd.DatetimeIndex:
+        """Converts timestamps to the tz of the ts column, if known.
+
+        Timezone-naive timestamps are taken to be UTC, so that every one is
+        written with its UTC offset.
+        """
+        idx = pd.DatetimeIndex(pd.to_datetime(ts, utc=True))
+        if self._iana is not None:
+            idx = idx.tz_convert(self._iana)
+        return idx
+
+    def _write(self, idx: pd.DatetimeIndex, columns: List[pd.Series]):
+        self._writer.writerows(
+            zip(*_format_rows(idx, columns, self._tz, self._units)))